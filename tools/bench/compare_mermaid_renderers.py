@@ -13,19 +13,25 @@ The harness is corpus-driven by default:
 from __future__ import annotations
 
 import argparse
+import collections
 import datetime as _dt
+import functools
 import hashlib
 import json
 import math
 import os
 import platform
+import queue
 import re
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator, TextIO
 
 from corpus_utils import (
     Corpus,
@@ -42,6 +48,7 @@ DEFAULT_MARKDOWN_OUT = "target/bench/renderer_comparison.md"
 DEFAULT_JSON_OUT = "target/bench/renderer_comparison.json"
 DEFAULT_COMMAND_TIMEOUT_SECONDS = 30 * 60
 DEFAULT_METADATA_TIMEOUT_SECONDS = 30
+STREAM_PIPE_BUFFER_BYTES = 1 << 16
 MERMAID_JS_MAX_SAMPLES = 10_000
 MERMAID_JS_NAVIGATION_TIMEOUT_MS = 30_000
 MERMAID_JS_FIXTURE_TIMEOUT_GRACE_MS = 60_000
@@ -50,30 +57,16 @@ DEFAULT_QUICK_FILTER = (
     r"sequence_medium|state_tiny|state_medium|class_tiny|class_medium)"
 )
 
+# Resolved once per process; report timestamps use this fixed local offset.
+_LOCAL_TZ = _dt.datetime.now().astimezone().tzinfo
 _ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+_ANSI_SUB = _ANSI_RE.sub
+_UNIT_TO_NANOS = {"ns": 1.0, "us": 1e3, "µs": 1e3, "μs": 1e3, "ms": 1e6, "s": 1e9}
 
 
 def strip_ansi(text: str) -> str:
-    return _ANSI_RE.sub("", text)
-
-
-@dataclass(frozen=True)
-class TimeEstimate:
-    value: float
-    unit: str
-
-    def to_nanos(self) -> float:
-        u = strip_ansi(self.unit).strip()
-        u = u.replace("μ", "µ")
-        if u == "ns":
-            return self.value
-        if u in ("us", "µs", "μs"):
-            return self.value * 1e3
-        if u == "ms":
-            return self.value * 1e6
-        if u == "s":
-            return self.value * 1e9
-        raise ValueError(f"unknown time unit: {self.unit!r}")
+    # Uncolored output is the common case; skip the regex when no escape byte is present.
+    return _ANSI_SUB("", text) if "\x1b" in text else text
 
 
 @dataclass(frozen=True)
@@ -95,13 +88,13 @@ class ComparisonSnapshot:
     fixture_inputs: dict[str, dict[str, object]]
 
 
+_PRETTY_TIME_SCALES = ((1e3, 1.0, "ns"), (1e6, 1e3, "µs"), (1e9, 1e6, "ms"))
+
+
 def pretty_time(nanos: float) -> str:
-    if nanos < 1e3:
-        return f"{nanos:.2f} ns"
-    if nanos < 1e6:
-        return f"{nanos / 1e3:.2f} µs"
-    if nanos < 1e9:
-        return f"{nanos / 1e6:.2f} ms"
+    for limit, scale, unit in _PRETTY_TIME_SCALES:
+        if nanos < limit:
+            return f"{nanos / scale:.2f} {unit}"
     return f"{nanos / 1e9:.2f} s"
 
 
@@ -154,6 +147,89 @@ def run(
     return proc.stdout
 
 
+def run_lines(
+    cmd: list[str],
+    cwd: Path,
+    *,
+    env: dict[str, str] | None = None,
+    timeout_seconds: int = DEFAULT_COMMAND_TIMEOUT_SECONDS,
+    echo: bool = True,
+    echo_prefix: str = "",
+    tail_lines: int = 200,
+) -> Iterator[str]:
+    """
+    Yield combined stdout/stderr lines while the command is still running.
+
+    Echoed lines start with `echo_prefix`, which tells concurrent runners apart on a shared
+    terminal. Only the last `tail_lines` lines are retained for failure messages, so long
+    Criterion runs are parsed as they arrive instead of being buffered in full. A reader thread
+    drains the pipe independently of the consumer, so parsing never stalls the child on a full
+    pipe.
+    """
+    proc_env = os.environ.copy()
+    if env:
+        proc_env.update(env)
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(cwd),
+        env=proc_env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        # Fill the pipe reader in large chunks; lines are still yielded as soon as they arrive.
+        bufsize=STREAM_PIPE_BUFFER_BYTES,
+    )
+    expired = threading.Event()
+
+    def expire() -> None:
+        expired.set()
+        proc.kill()
+
+    pending: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+
+    def drain() -> None:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            pending.put(line)
+        pending.put(None)
+
+    reader = threading.Thread(target=drain, daemon=True)
+    watchdog = threading.Timer(timeout_seconds, expire)
+    watchdog.daemon = True
+    tail: collections.deque[str] = collections.deque(maxlen=tail_lines)
+    reader.start()
+    watchdog.start()
+    try:
+        for line in iter(pending.get, None):
+            tail.append(line)
+            if echo:
+                # One write per line keeps concurrent runners' lines whole.
+                sys.stdout.write(echo_prefix + line)
+            yield line
+        returncode = proc.wait()
+    finally:
+        watchdog.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        reader.join()
+        if proc.stdout is not None:
+            proc.stdout.close()
+    output = "".join(tail)
+    if expired.is_set():
+        raise RuntimeError(
+            f"command timed out after {timeout_seconds}s in {cwd}\n"
+            f"$ {' '.join(cmd)}\n\n{output}"
+        )
+    if returncode != 0:
+        raise RuntimeError(
+            f"command failed (exit {returncode}) in {cwd}\n"
+            f"$ {' '.join(cmd)}\n\n{output}"
+        )
+
+
 def short_error(value: object, *, max_chars: int = 4000) -> str:
     text = str(value)
     if len(text) <= max_chars:
@@ -167,22 +243,22 @@ _SKIP_LINE = re.compile(
 )
 
 
-def parse_skip_lines(text: str) -> dict[str, list[str]]:
-    skipped: dict[str, list[str]] = {}
-    for raw in text.splitlines():
+def parse_skip_lines(text: str | Iterable[str]) -> dict[str, list[str]]:
+    skipped: dict[str, dict[str, None]] = {}
+    for raw in text.splitlines() if isinstance(text, str) else text:
         line = strip_ansi(raw.rstrip("\r\n"))
+        # `_SKIP_LINE` is anchored on this literal; most lines fail here without a regex match.
+        if not line.startswith("[bench][skip]["):
+            continue
         m = _SKIP_LINE.match(line)
         if not m:
             continue
-        group = m.group("group")
-        name = m.group("name")
-        skipped.setdefault(group, []).append(name)
-    for k in list(skipped.keys()):
-        skipped[k] = sorted(set(skipped[k]))
-    return skipped
+        skipped.setdefault(m.group("group"), {})[m.group("name")] = None
+    return {group: sorted(names) for group, names in skipped.items()}
 
 
 def merge_skips(*items: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Union skip maps; ordering is applied once here, so inputs need not be sorted."""
     merged: dict[str, set[str]] = {}
     for item in items:
         for group, names in item.items():
@@ -326,14 +402,14 @@ def snapshot_files(paths: dict[str, Path]) -> dict[str, dict[str, object]]:
 
 def locked_mermaid_version(lock_path: Path) -> str | None:
     try:
-        data = json.loads(lock_path.read_text(encoding="utf-8"))
+        data = json.loads(lock_path.read_bytes())
         version = (
             (data.get("packages") or {})
             .get("node_modules/mermaid", {})
             .get("version")
         )
         return version.strip() if isinstance(version, str) and version.strip() else None
-    except (OSError, json.JSONDecodeError, AttributeError):
+    except (OSError, ValueError, AttributeError):
         return None
 
 
@@ -359,7 +435,9 @@ def provenance_verification_errors(
     return errors
 
 
+@functools.lru_cache(maxsize=None)
 def rustc_verbose(*, toolchain: str | None = None, cwd: Path | None = None) -> str:
+    # Every report section asks for the same toolchain's `rustc -Vv`; run it once per process.
     try:
         command = ["rustc"]
         if toolchain:
@@ -379,6 +457,19 @@ def rustc_verbose(*, toolchain: str | None = None, cwd: Path | None = None) -> s
         return "unknown"
 
 
+def _proc_cpuinfo_model_name() -> str | None:
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                key, sep, value = line.partition(":")
+                if sep and key.strip().lower() == "model name" and value.strip():
+                    return value.strip()
+    except OSError:
+        pass
+    return None
+
+
+@functools.lru_cache(maxsize=1)
 def best_effort_cpu_model() -> str:
     try:
         if sys.platform.startswith("win"):
@@ -413,6 +504,11 @@ def best_effort_cpu_model() -> str:
             if out:
                 return out
         else:
+            # /proc/cpuinfo carries the same "model name" as lscpu on x86 without a process
+            # spawn; other architectures often omit it there, so lscpu stays the fallback.
+            model = _proc_cpuinfo_model_name()
+            if model:
+                return model
             out = subprocess.run(
                 ["lscpu"],
                 stdout=subprocess.PIPE,
@@ -434,6 +530,12 @@ def best_effort_cpu_model() -> str:
     return platform.processor() or "unknown"
 
 
+_GROUP_ALTERNATION = re.compile(r"(?P<prefix>[A-Za-z0-9_-]+)/\((?P<body>[^)]+)\)")
+_BENCH_NAME_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-"
+)
+
+
 def expand_filter_to_exact_benches(filter_expr: str) -> list[str]:
     """
     Expand a limited, common "group/(a|b|c)" filter form into exact benchmark names.
@@ -443,7 +545,7 @@ def expand_filter_to_exact_benches(filter_expr: str) -> list[str]:
     filter like "end_to_end/(a|b)" would match nothing there.
     """
     text = filter_expr.strip()
-    m = re.fullmatch(r"(?P<prefix>[A-Za-z0-9_-]+)/\((?P<body>[^)]+)\)", text)
+    m = _GROUP_ALTERNATION.fullmatch(text)
     if not m:
         return [text]
 
@@ -451,64 +553,85 @@ def expand_filter_to_exact_benches(filter_expr: str) -> list[str]:
     alts = [p.strip() for p in m.group("body").split("|") if p.strip()]
     out: list[str] = []
     for name in alts:
-        if not re.fullmatch(r"[A-Za-z0-9_-]+", name):
+        if not _BENCH_NAME_CHARS.issuperset(name):
             return [text]
         out.append(f"{prefix}/{name}")
     return out or [text]
 
 
-_LINE_NAME_ONLY = re.compile(r"^(?P<prefix>[A-Za-z0-9_\-]+)/(?P<name>[A-Za-z0-9_\-]+)\s*$")
-_LINE_TIME_ONLY = re.compile(r"^\s*time:\s*\[(?P<body>.+?)\]\s*$")
-_LINE_INLINE = re.compile(
-    r"^(?P<prefix>[A-Za-z0-9_\-]+)/(?P<name>[A-Za-z0-9_\-]+)\s+"
-    r"time:\s*\[(?P<body>.+?)\]\s*$"
+_LINE_NAMED = re.compile(
+    r"^(?:"
+    r"(?P<inline>(?P<iprefix>[A-Za-z0-9_\-]+)/(?P<iname>[A-Za-z0-9_\-]+)"
+    r"\s+time:\s*\[(?P<ibody>[^\]]+)\])"
+    r"|(?P<named>(?P<nprefix>[A-Za-z0-9_\-]+)/(?P<nname>[A-Za-z0-9_\-]+))"
+    r")\s*$"
 )
+_LINE_TIME_ONLY = re.compile(r"^\s*time:\s*\[(?P<body>[^\]]+)\]\s*$")
+_BRACKET_NUM_UNIT = re.compile(r"([0-9]+(?:\.[0-9]+)?)\s*([A-Za-zµμ]+)")
 
 
-def parse_criterion_times(text: str, prefix: str) -> dict[str, TimeEstimate]:
-    """Parse Criterion output and return mid estimates by benchmark name."""
-    times: dict[str, TimeEstimate] = {}
-    cur: str | None = None
+def parse_criterion_times(
+    text: str | Iterable[str], prefix: str
+) -> dict[str, float]:
+    """
+    Parse Criterion output and return mid estimates in nanoseconds by benchmark name.
 
-    for raw in text.splitlines():
-        line = strip_ansi(raw.rstrip("\r\n"))
+    `text` may be the full output or an iterable of lines, such as a `run_lines` stream.
+    """
+    times: dict[str, float] = {}
+    cur: str | None = None
+    # Loop-local aliases avoid global and attribute lookups on every line of long logs.
+    match_named = _LINE_NAMED.match
+    match_time = _LINE_TIME_ONLY.match
+    parse_time = _parse_bracket_time
+    # A complete buffer is stripped in one regex pass; streamed lines are stripped as they arrive.
+    lines = strip_ansi(text).splitlines() if isinstance(text, str) else map(strip_ansi, text)
+
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        # After a bare name, Criterion's next interesting line is its time line, so try that
+        # shape first. Time lines and named lines are mutually exclusive.
+        if cur is not None and "time:" in line:
+            m_time = match_time(line)
+            if m_time is not None:
+                estimate = parse_time(m_time.group("body"))
+                if estimate is not None:
+                    times[cur] = estimate
+                cur = None
+                continue
 
-        m_inline = _LINE_INLINE.match(line)
-        if m_inline and m_inline.group("prefix") == prefix:
-            name = m_inline.group("name")
-            estimate = _parse_bracket_time(m_inline.group("body"))
-            if estimate is not None:
-                times[name] = estimate
-            cur = None
+        # Benchmark names need a slash, so most build and progress noise is rejected without
+        # entering the regex engine.
+        if "/" not in line:
             continue
-
-        m_name = _LINE_NAME_ONLY.match(line)
-        if m_name and m_name.group("prefix") == prefix:
-            cur = m_name.group("name")
+        m = match_named(line)
+        if m is None:
             continue
 
-        if cur is not None:
-            m_time = _LINE_TIME_ONLY.match(line)
-            if m_time:
-                estimate = _parse_bracket_time(m_time.group("body"))
+        if m.lastgroup == "inline":
+            if m.group("iprefix") == prefix:
+                estimate = parse_time(m.group("ibody"))
                 if estimate is not None:
-                    times[cur] = estimate
+                    times[m.group("iname")] = estimate
                 cur = None
+        elif m.group("nprefix") == prefix:
+            cur = m.group("nname")
 
     return times
 
 
-def _parse_bracket_time(body: str) -> TimeEstimate | None:
-    # Criterion prints: "<lo> <unit> <mid> <unit> <hi> <unit>".
-    body = strip_ansi(body).strip()
-    pairs = re.findall(r"([0-9]+(?:\.[0-9]+)?)\s*([A-Za-zµμ]+)", body)
+def _parse_bracket_time(body: str) -> float | None:
+    # Criterion prints: "<lo> <unit> <mid> <unit> <hi> <unit>". Callers pass a slice of a line
+    # that has already been through `strip_ansi`.
+    pairs = _BRACKET_NUM_UNIT.findall(body)
     if len(pairs) < 2:
         return None
     mid_value, mid_unit = pairs[1]
     try:
-        return TimeEstimate(float(mid_value), mid_unit)
-    except ValueError:
-        return None
+        return float(mid_value) * _UNIT_TO_NANOS[mid_unit]
+    except KeyError:
+        # A Criterion format change should fail loudly rather than silently drop the bench.
+        raise ValueError(f"unknown time unit: {mid_unit!r}") from None
 
 
 _LIST_LINE = re.compile(r"^(?P<bench>[A-Za-z0-9_/-]+):\s*benchmark\s*$")
@@ -619,31 +742,25 @@ def prepare_criterion_runner(
     )
 
 
-def run_prepared_criterion(
-    runner: PreparedCriterionRunner,
-    args: list[str],
-    *,
-    cwd: Path,
-    env: dict[str, str] | None = None,
-) -> str:
-    return run([str(runner.executable), "--bench", *args], cwd=cwd, env=env)
-
-
 def list_criterion_benches(
     *,
     cwd: Path,
     runner: PreparedCriterionRunner,
     env: dict[str, str] | None = None,
 ) -> CriterionBenchList:
-    out = run_prepared_criterion(runner, ["--list"], cwd=cwd, env=env)
+    # Bench names and skip lines are collected in the same streamed pass over `--list`.
     benches: set[str] = set()
-    for raw in out.splitlines():
-        line = strip_ansi(raw).strip()
-        m = _LIST_LINE.match(line)
-        if not m:
-            continue
-        benches.add(m.group("bench"))
-    return CriterionBenchList(benches=benches, skipped=parse_skip_lines(out))
+    skip_lines: list[str] = []
+    for raw in run_lines(
+        [str(runner.executable), "--bench", "--list"], cwd=cwd, env=env, echo=False
+    ):
+        line = strip_ansi(raw.rstrip("\r\n"))
+        m = _LIST_LINE.match(line.strip())
+        if m:
+            benches.add(m.group("bench"))
+        elif "[bench][skip]" in line:
+            skip_lines.append(line)
+    return CriterionBenchList(benches=benches, skipped=parse_skip_lines(skip_lines))
 
 
 def split_exact_bench(exact: str) -> tuple[str, str]:
@@ -654,7 +771,34 @@ def split_exact_bench(exact: str) -> tuple[str, str]:
 
 def read_fixture_source(repo_root: Path, name: str, fixture: CorpusFixture | None) -> str | None:
     path = resolve_merman_fixture_path(repo_root, name, fixture)
-    return path.read_text(encoding="utf-8") if path.exists() else None
+    try:
+        # Decode the bytes as-is, matching the input merman's `include_str!` benches see.
+        return path.read_bytes().decode("utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _criterion_sample_command(
+    runner: PreparedCriterionRunner,
+    *,
+    sample_size: int,
+    warm_up: int,
+    measurement: int,
+    pin_cpus: str | None,
+) -> list[str]:
+    return [
+        *pinned_command_prefix(pin_cpus),
+        str(runner.executable),
+        "--bench",
+        "--noplot",
+        "--sample-size",
+        str(sample_size),
+        "--warm-up-time",
+        str(warm_up),
+        "--measurement-time",
+        str(measurement),
+        "--discard-baseline",
+    ]
 
 
 def bench_exact(
@@ -666,24 +810,80 @@ def bench_exact(
     warm_up: int,
     measurement: int,
     env: dict[str, str] | None = None,
-) -> str:
-    return run_prepared_criterion(
+    pin_cpus: str | None = None,
+    echo_prefix: str = "",
+) -> Iterator[str]:
+    command = _criterion_sample_command(
         runner,
-        [
-            "--noplot",
-            "--sample-size",
-            str(sample_size),
-            "--warm-up-time",
-            str(warm_up),
-            "--measurement-time",
-            str(measurement),
-            "--discard-baseline",
-            "--exact",
-            exact,
-        ],
-        cwd=cwd,
-        env=env,
+        sample_size=sample_size,
+        warm_up=warm_up,
+        measurement=measurement,
+        pin_cpus=pin_cpus,
     )
+    return run_lines([*command, "--exact", exact], cwd=cwd, env=env, echo_prefix=echo_prefix)
+
+
+def bench_group(
+    *,
+    cwd: Path,
+    runner: PreparedCriterionRunner,
+    group: str,
+    sample_size: int,
+    warm_up: int,
+    measurement: int,
+    env: dict[str, str] | None = None,
+    pin_cpus: str | None = None,
+    echo_prefix: str = "",
+) -> Iterator[str]:
+    command = _criterion_sample_command(
+        runner,
+        sample_size=sample_size,
+        warm_up=warm_up,
+        measurement=measurement,
+        pin_cpus=pin_cpus,
+    )
+    return run_lines([*command, f"{group}/"], cwd=cwd, env=env, echo_prefix=echo_prefix)
+
+
+def batchable_groups(requested: list[str], listed: set[str]) -> dict[str, list[str]]:
+    """
+    Return groups that can be sampled with one `<group>/` filter invocation.
+
+    A bare `<group>/` filter selects the same benches whether Criterion reads it as a regex
+    (<=0.5) or a substring (>=0.8). So a group is batched only when the listed benches containing
+    that filter are exactly the requested ones, and nothing unrequested gets sampled.
+    """
+    by_group: dict[str, list[str]] = {}
+    for exact in requested:
+        group, _ = split_exact_bench(exact)
+        if group:
+            by_group.setdefault(group, []).append(exact)
+    return {
+        group: members
+        for group, members in by_group.items()
+        if len(members) > 1 and {b for b in listed if f"{group}/" in b} == set(members)
+    }
+
+
+_CPU_LIST = re.compile(r"[0-9]+(?:-[0-9]+)?(?:,[0-9]+(?:-[0-9]+)?)*")
+
+
+def pinned_command_prefix(pin_cpus: str | None) -> list[str]:
+    """Return a `taskset` prefix that confines a sampling command to a CPU list."""
+    if pin_cpus is None:
+        return []
+    if not _CPU_LIST.fullmatch(pin_cpus):
+        raise ValueError(f"invalid CPU list {pin_cpus!r}; expected taskset syntax like 2-3 or 2,4")
+    if not sys.platform.startswith("linux") or shutil.which("taskset") is None:
+        raise ValueError("--pin-cpus requires Linux with `taskset` on PATH")
+    return ["taskset", "--cpu-list", pin_cpus]
+
+
+def _retain_skip_lines(lines: Iterable[str], sink: list[str]) -> Iterator[str]:
+    for line in lines:
+        if "[bench][skip]" in line:
+            sink.append(line)
+        yield line
 
 
 def run_native_runner(
@@ -697,6 +897,8 @@ def run_native_runner(
     warm_up: int,
     measurement: int,
     env: dict[str, str] | None = None,
+    pin_cpus: str | None = None,
+    echo_prefix: str = "",
 ) -> dict[str, Any]:
     skipped_exact = {
         f"{group}/{name}"
@@ -709,7 +911,7 @@ def run_native_runner(
     ]
     times_ns: dict[str, float] = {}
     errors: dict[str, str] = {}
-    output_skips: dict[str, list[str]] = {}
+    output_skips: list[dict[str, list[str]]] = []
     executable_status = "verified"
 
     try:
@@ -719,15 +921,56 @@ def run_native_runner(
         errors["__runner__"] = short_error(error)
 
     benches_to_run = available if executable_status == "verified" else []
+    batched_groups: list[str] = []
+    for group, members in batchable_groups(benches_to_run, bench_list.benches).items():
+        print(
+            "[bench]",
+            label + ":",
+            f"{runner.executable} --bench ... {group}/ ({len(members)} benches)",
+        )
+        batch_skip_lines: list[str] = []
+        try:
+            lines = bench_group(
+                cwd=cwd,
+                runner=runner,
+                group=group,
+                sample_size=sample_size,
+                warm_up=warm_up,
+                measurement=measurement,
+                env=env,
+                pin_cpus=pin_cpus,
+                echo_prefix=echo_prefix,
+            )
+            parsed = parse_criterion_times(
+                _retain_skip_lines(lines, batch_skip_lines), prefix=group
+            )
+        except Exception as e:
+            # Fall back to exact invocations so one failing bench does not sink the group.
+            print(
+                "[bench]",
+                label + ":",
+                f"batched {group}/ run failed, retrying per bench: {short_error(e, max_chars=200)}",
+            )
+            continue
+        batched_groups.append(group)
+        output_skips.append(parse_skip_lines(batch_skip_lines))
+        for exact in members:
+            estimate_ns = parsed.get(split_exact_bench(exact)[1])
+            if estimate_ns is not None:
+                times_ns[exact] = estimate_ns
+
     for exact in benches_to_run:
+        if exact in times_ns:
+            continue
         prefix, name = split_exact_bench(exact)
         print(
             "[bench]",
             label + ":",
             f"{runner.executable} --bench ... --exact {exact}",
         )
+        skip_lines: list[str] = []
         try:
-            out = bench_exact(
+            lines = bench_exact(
                 cwd=cwd,
                 runner=runner,
                 exact=exact,
@@ -735,23 +978,24 @@ def run_native_runner(
                 warm_up=warm_up,
                 measurement=measurement,
                 env=env,
+                pin_cpus=pin_cpus,
+                echo_prefix=echo_prefix,
+            )
+            parsed = parse_criterion_times(
+                _retain_skip_lines(lines, skip_lines), prefix=prefix
             )
         except Exception as e:
             errors[exact] = short_error(e)
             continue
 
-        output_skips = merge_skips(output_skips, parse_skip_lines(out))
-        parsed = parse_criterion_times(out, prefix=prefix)
-        estimate = parsed.get(name)
-        if estimate is None:
+        output_skips.append(parse_skip_lines(skip_lines))
+        estimate_ns = parsed.get(name)
+        if estimate_ns is None:
             errors[exact] = "Criterion output did not include a parseable mid estimate."
             continue
-        try:
-            times_ns[exact] = estimate.to_nanos()
-        except Exception as e:
-            errors[exact] = short_error(e)
+        times_ns[exact] = estimate_ns
 
-    skipped = merge_skips(bench_list.skipped, output_skips)
+    skipped = merge_skips(bench_list.skipped, *output_skips)
     if executable_status == "verified":
         try:
             verify_criterion_executable(runner)
@@ -768,6 +1012,7 @@ def run_native_runner(
         "times_ns": times_ns,
         "estimate_kind": "criterion_console_mid_point",
         "raw_samples_retained": False,
+        "batched_groups": batched_groups,
         "executable": {
             "path": str(runner.executable),
             "sha256": runner.sha256,
@@ -1058,7 +1303,8 @@ def run_mermaid_js(
                     "navigationTimeoutMs": MERMAID_JS_NAVIGATION_TIMEOUT_MS,
                     "fixtureTimeoutMs": fixture_timeout_ms,
                 },
-                indent=2,
+                # Only the Node runner reads this file, so skip the indentation.
+                separators=(",", ":"),
             ),
             encoding="utf-8",
         )
@@ -1356,7 +1602,19 @@ def write_json_report(path: Path, report: dict[str, Any]) -> None:
 
 def write_markdown(out_path: Path, report: dict[str, Any]) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
+    # Stream into a sibling temp file and swap it in, so a failure mid-report never leaves a
+    # truncated file where the previous report was.
+    temporary = out_path.parent / f".{out_path.name}.{os.getpid()}.tmp"
+    try:
+        with temporary.open("w", encoding="utf-8", buffering=1 << 16) as handle:
+            _emit_markdown(handle, report)
+        os.replace(temporary, out_path)
+    finally:
+        if temporary.exists():
+            temporary.unlink()
 
+
+def _emit_markdown(handle: TextIO, report: dict[str, Any]) -> None:
     def fmt_rev(label: str, rev: str | None) -> str:
         if rev is None:
             return f"- {label}: unknown"
@@ -1377,160 +1635,197 @@ def write_markdown(out_path: Path, report: dict[str, Any]) -> None:
             return str(input_status).replace("_", " ")
         return fmt_ratio(row["ratios"]["merman_over_mermaid_rs_renderer"])
 
+    js_sample_stats = report["runners"]["mermaid_js"].get("sample_stats_ns", {})
+
     def fmt_js_stat(row: dict[str, Any], field: str) -> str:
-        stats = (
-            report["runners"]["mermaid_js"]
-            .get("sample_stats_ns", {})
-            .get(row["fixture"], {})
-        )
-        value = stats.get(field)
+        value = js_sample_stats.get(row["fixture"], {}).get(field)
         if field == "count":
             return str(value) if isinstance(value, int) else "-"
         return pretty_time(float(value)) if isinstance(value, (int, float)) else "-"
 
-    lines: list[str] = []
-    lines.append("# Renderer Performance Comparison")
-    lines.append("")
-    lines.append("> Generated by `tools/bench/compare_mermaid_renderers.py`.")
-    lines.append("")
-    lines.append("## Environment")
-    lines.append("")
+    def fmt_result_row(row: dict[str, Any]) -> str:
+        return (
+            f"| `{row['benchmark']}` | {row['family']} | {fmt_cell(row, 'merman')} | "
+            f"{fmt_cell(row, 'mermaid_rs_renderer')} | {fmt_cell(row, 'mermaid_js')} | "
+            f"{fmt_js_stat(row, 'p95')} | {fmt_js_stat(row, 'count')} | "
+            f"{fmt_mmdr_ratio(row)} | "
+            f"{fmt_ratio(row['ratios']['merman_over_mermaid_js'])} |"
+        )
+
+    def fmt_family_row(row: dict[str, Any]) -> str:
+        measured = row["measured"]
+        ratios = row["geomean_ratios"]
+        return (
+            f"| {row['family']} | {row['fixtures']} | {measured['merman']} | "
+            f"{measured['mermaid_rs_renderer']} | {measured['mermaid_js']} | "
+            f"{fmt_ratio(ratios['merman_over_mermaid_rs_renderer'])} |"
+        )
+
+    def emit(line: str) -> None:
+        # Separator first, so the file ends exactly like "\n".join(lines) would.
+        handle.write("\n")
+        handle.write(line)
+
+    handle.write("# Renderer Performance Comparison")
+    emit("")
+    emit("> Generated by `tools/bench/compare_mermaid_renderers.py`.")
+    emit("")
+    emit("## Environment")
+    emit("")
     env = report["environment"]
-    lines.append(f"- Timestamp: \"{report['generated_at']}\"")
-    lines.append(f"- OS: \"{env['os']}\"")
-    lines.append(f"- Machine: \"{env['machine']}\"")
-    lines.append(f"- CPU: \"{env['cpu']}\"")
-    lines.append(f"- Python: \"{env['python']}\"")
-    lines.append(f"- mmdr toolchain: \"{env['mmdr_toolchain']}\"")
+    emit(f"- Timestamp: \"{report['generated_at']}\"")
+    emit(f"- OS: \"{env['os']}\"")
+    emit(f"- Machine: \"{env['machine']}\"")
+    emit(f"- CPU: \"{env['cpu']}\"")
+    emit(f"- Python: \"{env['python']}\"")
+    emit(f"- mmdr toolchain: \"{env['mmdr_toolchain']}\"")
     js_meta = report["runners"]["mermaid_js"].get("meta", {})
     if js_meta.get("node"):
-        lines.append(f"- Node: \"{js_meta['node']}\"")
+        emit(f"- Node: \"{js_meta['node']}\"")
     if js_meta.get("chromium"):
-        lines.append(f"- Chromium: \"{js_meta['chromium']}\"")
+        emit(f"- Chromium: \"{js_meta['chromium']}\"")
     if js_meta.get("puppeteer"):
-        lines.append(f"- Puppeteer: \"{js_meta['puppeteer']}\"")
+        emit(f"- Puppeteer: \"{js_meta['puppeteer']}\"")
     if js_meta.get("mermaid_cli"):
-        lines.append(f"- mermaid-cli: \"{js_meta['mermaid_cli']}\"")
-    lines.append(fmt_rev("merman", report["runners"]["merman"].get("revision")))
-    lines.append(fmt_rev("mermaid-rs-renderer", report["runners"]["mermaid_rs_renderer"].get("revision")))
-    lines.append(fmt_rev("mermaid-js", report["runners"]["mermaid_js"].get("revision")))
-    lines.append("- Rust:")
-    lines.append("")
-    lines.append("```")
-    lines.append(env["rust"])
-    lines.append("```")
-    lines.append("")
-    lines.append("- mmdr Rust:")
-    lines.append("")
-    lines.append("```")
-    lines.append(env["mmdr_rust"])
-    lines.append("```")
-    lines.append("")
+        emit(f"- mermaid-cli: \"{js_meta['mermaid_cli']}\"")
+    emit(fmt_rev("merman", report["runners"]["merman"].get("revision")))
+    emit(fmt_rev("mermaid-rs-renderer", report["runners"]["mermaid_rs_renderer"].get("revision")))
+    emit(fmt_rev("mermaid-js", report["runners"]["mermaid_js"].get("revision")))
+    emit("- Rust:")
+    emit("")
+    emit("```")
+    emit(env["rust"])
+    emit("```")
+    emit("")
+    emit("- mmdr Rust:")
+    emit("")
+    emit("```")
+    emit(env["mmdr_rust"])
+    emit("```")
+    emit("")
     contract = report["contract"]
     provenance = report["provenance"]
-    lines.append("## Evidence Status")
-    lines.append("")
-    lines.append(f"- Evidence class: `{report['method']['evidence_class']}`")
-    lines.append(f"- Contract status: `{contract['status']}`")
-    lines.append(f"- Baseline eligible: `{str(contract['baseline_eligible']).lower()}`")
-    lines.append(
+    emit("## Evidence Status")
+    emit("")
+    emit(f"- Evidence class: `{report['method']['evidence_class']}`")
+    emit(f"- Contract status: `{contract['status']}`")
+    emit(f"- Baseline eligible: `{str(contract['baseline_eligible']).lower()}`")
+    emit(
         "- Post-sampling provenance: "
         f"`{provenance['post_sampling']['status']}`"
     )
     for label, repo in provenance["repositories"].items():
-        lines.append(
+        emit(
             f"- {label} worktree: `{'dirty' if repo['dirty'] else 'clean'}`; "
             f"fingerprint `{repo['worktree_sha256']}`"
         )
     if contract["errors"]:
-        lines.append("- Contract errors:")
+        emit("- Contract errors:")
         for error in contract["errors"]:
-            lines.append(f"  - {error}")
-    lines.append("")
-    lines.append("## Method")
-    lines.append("")
+            emit(f"  - {error}")
+    emit("")
+    emit("## Method")
+    emit("")
     selection = report["selection"]
-    lines.append(f"- Mode: `{report['mode']}`")
-    lines.append(f"- Selection: `{selection['kind']}`")
+    emit(f"- Mode: `{report['mode']}`")
+    emit(f"- Selection: `{selection['kind']}`")
     if selection["kind"] == "suite":
-        lines.append(f"- Corpus: `{selection['corpus_path']}`")
-        lines.append(f"- Suite: `{selection['suite']}`")
+        emit(f"- Corpus: `{selection['corpus_path']}`")
+        emit(f"- Suite: `{selection['suite']}`")
     else:
-        lines.append(f"- Filter: \"{selection['filter']}\"")
-    lines.append(
+        emit(f"- Filter: \"{selection['filter']}\"")
+    emit(
         f"- Sample size: {report['method']['sample_size']}, "
         f"warm-up: {report['method']['warm_up_seconds']}s, "
         f"measurement: {report['method']['measurement_seconds']}s"
     )
-    lines.append(
+    emit(
         "- Native Criterion targets are built once with `cargo bench --no-run`; "
         "the digest-verified executable is then invoked directly for discovery and timing."
     )
-    lines.append("- `merman`: `pipeline --bench ... --exact <benchmark>`")
-    lines.append(
+    if report["method"].get("pinned_cpus"):
+        emit(
+            f"- Native sampling was pinned with `taskset --cpu-list "
+            f"{report['method']['pinned_cpus']}`."
+        )
+    if report["method"].get("parallel_native_runners"):
+        emit(
+            "- Native runners were sampled concurrently (`--parallel`); their timings share CPU "
+            "and are noisier than serial runs."
+        )
+    emit("- `merman`: `pipeline --bench ... --exact <benchmark>`")
+    for key in ("merman", "mermaid_rs_renderer"):
+        runner = report["runners"][key]
+        if runner.get("batched_groups"):
+            emit(
+                f"- {runner['label']} sampled "
+                + ", ".join(f"`{group}/`" for group in runner["batched_groups"])
+                + " as one invocation per group because every listed bench was requested."
+            )
+    emit(
         "- `mermaid-rs-renderer` (mmdr): "
         "`renderer --bench ... --exact <benchmark>`"
     )
-    lines.append(
+    emit(
         "- Merman/mmdr ratios require byte-identical fixture inputs; non-identical rows retain "
         "their raw timings and measured coverage but are excluded from ratio and geomean aggregates."
     )
-    lines.append(
+    emit(
         "- Native values are Criterion console mid-point estimates; native raw samples are not retained."
     )
-    lines.append(
+    emit(
         "- `mermaid-js`: warm `mermaid.render()` calls in one Puppeteer/Chromium process; "
         "raw per-call samples and p95/p99 are retained in JSON."
     )
-    lines.append(
+    emit(
         "- Native Merman / browser Mermaid.js ratios are diagnostic context only, not a "
         "cross-transport performance ranking."
     )
-    lines.append("")
-    lines.append("## Coverage Summary")
-    lines.append("")
-    lines.append("| runner | requested | available | measured | missing | errors | skipped |")
-    lines.append("|---|---:|---:|---:|---:|---:|---:|")
+    emit("")
+    emit("## Coverage Summary")
+    emit("")
+    emit("| runner | requested | available | measured | missing | errors | skipped |")
+    emit("|---|---:|---:|---:|---:|---:|---:|")
     for key in ("merman", "mermaid_rs_renderer", "mermaid_js"):
         runner = report["runners"][key]
         cov = runner["coverage"]
-        lines.append(
+        emit(
             f"| {runner['label']} | {cov['requested']} | {cov['available']} | "
             f"{cov['measured']} | {cov['missing']} | {cov['errors']} | {cov['skipped']} |"
         )
-    lines.append("")
+    emit("")
     family_coverage = report["family_coverage"]
-    lines.append("## Family Coverage")
-    lines.append("")
-    lines.append(f"- Requested families: {family_coverage['requested_count']}")
-    lines.append(
+    emit("## Family Coverage")
+    emit("")
+    emit(f"- Requested families: {family_coverage['requested_count']}")
+    emit(
         "- Measured families: "
         f"Merman {family_coverage['measured_count']['merman']}, "
         f"mmdr {family_coverage['measured_count']['mermaid_rs_renderer']}, "
         f"Mermaid.js {family_coverage['measured_count']['mermaid_js']}"
     )
-    lines.append(
+    emit(
         "- Native same-byte comparable families: "
         f"{family_coverage['native_same_byte_comparable_count']}"
     )
     if family_coverage["native_not_same_byte_comparable"]:
-        lines.append(
+        emit(
             "- Not in the native same-byte comparable set: "
             + ", ".join(
                 f"`{family}`"
                 for family in family_coverage["native_not_same_byte_comparable"]
             )
         )
-    lines.append("")
+    emit("")
     fixture_inputs = report.get("fixture_inputs", {})
     if fixture_inputs:
         input_counts: dict[str, int] = {}
         for comparison in fixture_inputs.values():
             status = str(comparison.get("status") or "unknown")
             input_counts[status] = input_counts.get(status, 0) + 1
-        lines.append("## Input Comparability")
-        lines.append("")
-        lines.append(
+        emit("## Input Comparability")
+        emit("")
+        emit(
             "- "
             + ", ".join(
                 f"`{status}`: {count}" for status, count in sorted(input_counts.items())
@@ -1542,68 +1837,54 @@ def write_markdown(out_path: Path, report: dict[str, Any]) -> None:
             if comparison.get("status") != "identical"
         ]
         if non_identical:
-            lines.append("- Excluded from Merman/mmdr ratios: " + ", ".join(non_identical) + ".")
-        lines.append("")
-    lines.append("## Results")
-    lines.append("")
-    lines.append(
+            emit("- Excluded from Merman/mmdr ratios: " + ", ".join(non_identical) + ".")
+        emit("")
+    emit("## Results")
+    emit("")
+    emit(
         "| benchmark | family | merman | mermaid-rs-renderer | mermaid-js p50 | "
         "mermaid-js p95 | JS samples | ratio (merman / mmdr) | "
         "context (native merman / browser mermaid-js) |"
     )
-    lines.append("|---|---|---:|---:|---:|---:|---:|---:|---:|")
+    emit("|---|---|---:|---:|---:|---:|---:|---:|---:|")
     if report["rows"]:
-        for row in report["rows"]:
-            lines.append(
-                f"| `{row['benchmark']}` | {row['family']} | {fmt_cell(row, 'merman')} | "
-                f"{fmt_cell(row, 'mermaid_rs_renderer')} | {fmt_cell(row, 'mermaid_js')} | "
-                f"{fmt_js_stat(row, 'p95')} | {fmt_js_stat(row, 'count')} | "
-                f"{fmt_mmdr_ratio(row)} | "
-                f"{fmt_ratio(row['ratios']['merman_over_mermaid_js'])} |"
-            )
+        emit("\n".join(map(fmt_result_row, report["rows"])))
     else:
-        lines.append("| (no matches) | - | - | - | - | - | - | - | - |")
-    lines.append("")
+        emit("| (no matches) | - | - | - | - | - | - | - | - |")
+    emit("")
 
     if report.get("family_summary"):
-        lines.append("## Family Summary")
-        lines.append("")
-        lines.append(
+        emit("## Family Summary")
+        emit("")
+        emit(
             "| family | fixtures | merman measured | mmdr measured | mermaid-js measured | "
             "geo ratio (merman / mmdr) |"
         )
-        lines.append("|---|---:|---:|---:|---:|---:|")
-        for row in report["family_summary"]:
-            measured = row["measured"]
-            ratios = row["geomean_ratios"]
-            lines.append(
-                f"| {row['family']} | {row['fixtures']} | {measured['merman']} | "
-                f"{measured['mermaid_rs_renderer']} | {measured['mermaid_js']} | "
-                f"{fmt_ratio(ratios['merman_over_mermaid_rs_renderer'])} |"
-            )
-        lines.append("")
+        emit("|---|---:|---:|---:|---:|---:|")
+        emit("\n".join(map(fmt_family_row, report["family_summary"])))
+        emit("")
 
-    lines.append("## Quality and Coverage Caveat")
-    lines.append("")
-    lines.append(
+    emit("## Quality and Coverage Caveat")
+    emit("")
+    emit(
         "- Timings include only successful renders for each runner. Missing or errored fixtures reduce coverage; they are not folded into ratios."
     )
-    lines.append(
+    emit(
         "- Merman/mmdr ratios and family geomean columns include only byte-identical fixture inputs."
     )
-    lines.append(
+    emit(
         "- No Mermaid.js family geomean is emitted because native and browser transports are different lanes."
     )
-    lines.append(
+    emit(
         "- `merman` is parity-focused and should still be paired with SVG DOM/resvg comparison gates before using performance numbers as a release signal."
     )
-    lines.append(
+    emit(
         "- `mermaid-rs-renderer` has different goals and coverage. A faster partial renderer is not equivalent to a parity-compatible renderer."
     )
-    lines.append(
+    emit(
         "- The corpus records expected quality gates per fixture; this harness currently records those expectations but does not run DOM or raster comparisons."
     )
-    lines.append("")
+    emit("")
 
     for key in ("merman", "mermaid_rs_renderer", "mermaid_js"):
         runner = report["runners"][key]
@@ -1611,25 +1892,24 @@ def write_markdown(out_path: Path, report: dict[str, Any]) -> None:
         errors = runner.get("errors") or {}
         if not missing and not errors:
             continue
-        lines.append(f"## Availability: {runner['label']}")
-        lines.append("")
+        emit(f"## Availability: {runner['label']}")
+        emit("")
         if missing:
-            lines.append("Missing:")
-            lines.append("")
-            lines.append(", ".join(f"`{x}`" for x in missing))
-            lines.append("")
+            emit("Missing:")
+            emit("")
+            emit(", ".join(f"`{x}`" for x in missing))
+            emit("")
         if errors:
-            lines.append("Errors:")
-            lines.append("")
+            emit("Errors:")
+            emit("")
             for bench, message in sorted(errors.items()):
                 first_line = str(message).splitlines()[0] if str(message).splitlines() else str(message)
-                lines.append(f"- `{bench}`: {first_line}")
-            lines.append("")
+                emit(f"- `{bench}`: {first_line}")
+            emit("")
 
-    out_path.write_text("\n".join(lines), encoding="utf-8")
 
-
-def main(argv: list[str]) -> int:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     ap = argparse.ArgumentParser()
     ap.add_argument(
         "--preset",
@@ -1717,12 +1997,39 @@ def main(argv: list[str]) -> int:
     ap.add_argument("--sample-size", type=int, default=20)
     ap.add_argument("--warm-up", type=int, default=1)
     ap.add_argument("--measurement", type=int, default=1)
+    ap.add_argument(
+        "--parallel",
+        action="store_true",
+        help=(
+            "Sample merman and mermaid-rs-renderer concurrently. Roughly halves wall time, but "
+            "the runners compete for CPU, so keep it off for numbers you intend to publish."
+        ),
+    )
+    ap.add_argument(
+        "--pin-cpus",
+        default=None,
+        metavar="CPUS",
+        help=(
+            "Linux only: run native Criterion sampling under `taskset --cpu-list CPUS` "
+            "(e.g. 2-3) to reduce scheduler jitter. Both runners use the same set, so this "
+            "cannot be combined with --parallel."
+        ),
+    )
     ap.add_argument(
         "--skip-mermaid-js",
         action="store_true",
         help="Skip upstream Mermaid JS benchmarking via puppeteer.",
     )
-    args = ap.parse_args(argv)
+    return ap
+
+
+@functools.lru_cache(maxsize=1)
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+def main(argv: list[str]) -> int:
+    args = _build_parser().parse_args(argv)
 
     def argv_has(opt: str) -> bool:
         return any(a == opt or a.startswith(opt + "=") for a in argv)
@@ -1735,7 +2042,7 @@ def main(argv: list[str]) -> int:
         if not argv_has("--measurement"):
             args.measurement = 3
 
-    repo_root = Path(__file__).resolve().parents[2]
+    repo_root = _repo_root()
     corpus_path = (repo_root / args.corpus).resolve()
     corpus = load_corpus(corpus_path)
 
@@ -1773,6 +2080,20 @@ def main(argv: list[str]) -> int:
     json_out_path = (repo_root / args.json_out).resolve()
     mmdr_bench_env = {"MMDR_RUN_CRITERION_BENCHES": "1"}
 
+    if args.parallel and args.pin_cpus is not None:
+        # Concurrent runners pinned to one CPU list would compete for the same cores.
+        print(
+            "[bench][contract] --pin-cpus cannot be combined with --parallel",
+            file=sys.stderr,
+        )
+        return 2
+
+    try:
+        pinned_command_prefix(args.pin_cpus)
+    except ValueError as error:
+        print(f"[bench][contract] {error}", file=sys.stderr)
+        return 2
+
     if out_path == json_out_path:
         print(
             "[bench][contract] --out and --json-out must resolve to different files",
@@ -1851,54 +2172,76 @@ def main(argv: list[str]) -> int:
         fixture_inputs=fixture_inputs,
     )
 
-    merman_prepared = prepare_criterion_runner(
-        label="merman",
-        cwd=repo_root,
-        bench_bin="pipeline",
-        package="merman",
-        features="svg",
-        toolchain=None,
-    )
-    mmdr_prepared = prepare_criterion_runner(
-        label="mermaid-rs-renderer",
-        cwd=mmdr_dir,
-        bench_bin="renderer",
-        package=None,
-        features="benchmark",
-        env=mmdr_bench_env,
-        toolchain=args.mmdr_toolchain,
-    )
-    merman_list = list_criterion_benches(
-        cwd=repo_root,
-        runner=merman_prepared,
-    )
-    mmdr_list = list_criterion_benches(
-        cwd=mmdr_dir,
-        runner=mmdr_prepared,
-        env=mmdr_bench_env,
-    )
-
-    merman = run_native_runner(
-        label="merman",
-        cwd=repo_root,
-        runner=merman_prepared,
-        exact_benches=exact_benches,
-        bench_list=merman_list,
-        sample_size=args.sample_size,
-        warm_up=args.warm_up,
-        measurement=args.measurement,
-    )
-    mmdr = run_native_runner(
-        label="mermaid-rs-renderer",
-        cwd=mmdr_dir,
-        runner=mmdr_prepared,
-        exact_benches=exact_benches,
-        bench_list=mmdr_list,
-        sample_size=args.sample_size,
-        warm_up=args.warm_up,
-        measurement=args.measurement,
-        env=mmdr_bench_env,
+    def prepare_and_list(
+        cwd: Path,
+        env: dict[str, str] | None = None,
+        **prepare_kwargs: Any,
+    ) -> tuple[PreparedCriterionRunner, CriterionBenchList]:
+        prepared = prepare_criterion_runner(cwd=cwd, env=env, **prepare_kwargs)
+        return prepared, list_criterion_benches(cwd=cwd, runner=prepared, env=env)
+
+    # Building and listing never sample, so the two checkouts can always overlap here;
+    # only the measured phase below is gated behind --parallel.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        merman_future = pool.submit(
+            prepare_and_list,
+            repo_root,
+            label="merman",
+            bench_bin="pipeline",
+            package="merman",
+            features="svg",
+            toolchain=None,
+        )
+        mmdr_future = pool.submit(
+            prepare_and_list,
+            mmdr_dir,
+            mmdr_bench_env,
+            label="mermaid-rs-renderer",
+            bench_bin="renderer",
+            package=None,
+            features="benchmark",
+            toolchain=args.mmdr_toolchain,
+        )
+        merman_prepared, merman_list = merman_future.result()
+        mmdr_prepared, mmdr_list = mmdr_future.result()
+
+    native_jobs = (
+        functools.partial(
+            run_native_runner,
+            label="merman",
+            cwd=repo_root,
+            runner=merman_prepared,
+            exact_benches=exact_benches,
+            bench_list=merman_list,
+            sample_size=args.sample_size,
+            warm_up=args.warm_up,
+            measurement=args.measurement,
+            pin_cpus=args.pin_cpus,
+            echo_prefix="[merman] " if args.parallel else "",
+        ),
+        functools.partial(
+            run_native_runner,
+            label="mermaid-rs-renderer",
+            cwd=mmdr_dir,
+            runner=mmdr_prepared,
+            exact_benches=exact_benches,
+            bench_list=mmdr_list,
+            sample_size=args.sample_size,
+            warm_up=args.warm_up,
+            measurement=args.measurement,
+            env=mmdr_bench_env,
+            pin_cpus=args.pin_cpus,
+            echo_prefix="[mermaid-rs-renderer] " if args.parallel else "",
+        ),
     )
+    if args.parallel:
+        # The two Criterion runners share the host's cores, so this trades noise isolation for
+        # wall time. The report records the choice.
+        with ThreadPoolExecutor(max_workers=len(native_jobs)) as pool:
+            futures = [pool.submit(job) for job in native_jobs]
+            merman, mmdr = (future.result() for future in futures)
+    else:
+        merman, mmdr = (job() for job in native_jobs)
 
     mermaid_js = run_mermaid_js(
         repo_root=repo_root,
@@ -1995,7 +2338,7 @@ def main(argv: list[str]) -> int:
         provenance_errors=provenance_errors,
     )
 
-    ts = _dt.datetime.now(_dt.timezone.utc).astimezone().strftime("%Y-%m-%d %H:%M:%S %z")
+    ts = _dt.datetime.now(_LOCAL_TZ).strftime("%Y-%m-%d %H:%M:%S %z")
     family_summary = build_family_summary(rows)
     report: dict[str, Any] = {
         "schema_version": 3,
@@ -2009,6 +2352,8 @@ def main(argv: list[str]) -> int:
             "warm_up_seconds": args.warm_up,
             "measurement_seconds": args.measurement,
             "criterion_exact_benches": exact_benches,
+            "parallel_native_runners": args.parallel,
+            "pinned_cpus": args.pin_cpus,
             "native_estimate_kind": "criterion_console_mid_point",
             "native_raw_samples_retained": False,
             "browser_raw_samples_retained": require_mermaid_js,
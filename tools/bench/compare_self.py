@@ -2298,8 +2298,8 @@ def _measure_once(
             f"Criterion discovery has no preflight receipt for {exact_bench}"
         )
     prefix, name = split_exact_bench(exact_bench)
-    estimate = parse_criterion_times(output, prefix=prefix).get(name)
-    if estimate is None:
+    raw_ns = parse_criterion_times(output, prefix=prefix).get(name)
+    if raw_ns is None:
         skip_map = parse_skip_lines(output)
         reason = skip_map.get(prefix, [])
         detail = f"; skip={reason}" if reason else ""
@@ -2307,7 +2307,6 @@ def _measure_once(
             f"Criterion output did not contain a point estimate for {exact_bench}{detail}: "
             f"{_output_tail(output)}"
         )
-    raw_ns = estimate.to_nanos()
     normalized_ns = raw_ns / runner.recipe.logical_operations
     if not math.isfinite(normalized_ns) or normalized_ns <= 0.0:
         raise ContractViolation(
@@ -560,21 +560,22 @@ def compare_mmdr_fixture_inputs(
     comparisons: dict[str, dict[str, object]] = {}
     metadata = fixtures_by_name or {}
 
+    def describe(path: Path, root: Path) -> dict[str, object]:
+        relative = str(path.relative_to(root)).replace("\\", "/")
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return {"path": relative, "bytes": None, "sha256": None}
+        return {
+            "path": relative,
+            "bytes": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+
     for name in dict.fromkeys(fixture_names):
         merman_path = resolve_merman_fixture_path(repo_root, name, metadata.get(name))
         mmdr_path = mmdr_dir / "benches" / "fixtures" / f"{name}.mmd"
 
-        def describe(path: Path, root: Path) -> dict[str, object]:
-            relative = str(path.relative_to(root)).replace("\\", "/")
-            if not path.exists():
-                return {"path": relative, "bytes": None, "sha256": None}
-            data = path.read_bytes()
-            return {
-                "path": relative,
-                "bytes": len(data),
-                "sha256": hashlib.sha256(data).hexdigest(),
-            }
-
         merman = describe(merman_path, repo_root)
         mmdr = describe(mmdr_path, mmdr_dir)
         if merman["sha256"] is None and mmdr["sha256"] is None:
@@ -17,18 +17,33 @@ high-confidence benchmarking.
 from __future__ import annotations
 
 import argparse
+import collections
+import itertools
 import math
 import os
 import re
+import statistics
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
 
+from compare_mermaid_renderers import (
+    PreparedCriterionRunner,
+    criterion_executable_sha256,
+    criterion_prebuild_command,
+    parse_bench_executable,
+    run_lines,
+    verify_criterion_executable,
+)
 from corpus_utils import compare_mmdr_fixture_inputs
 
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
 @dataclass(frozen=True)
 class Duration:
     micros: float
@@ -39,35 +54,29 @@ TIME_LINE_RE = re.compile(
     r"^(?P<bench>[A-Za-z0-9_/-]+)\s+time:\s+\[(?P<body>[^\]]+)\]\s*$"
 )
 TIME_ONLY_RE = re.compile(r"^\s*time:\s+\[(?P<body>[^\]]+)\]\s*$")
+BENCH_NAME_RE = re.compile(r"^[A-Za-z0-9_/-]+$")
+_MICROS_PER_UNIT = {"ns": 1e-3, "µs": 1.0, "us": 1.0, "ms": 1e3, "s": 1e6}
+_DURATION_NUM_CHARS = frozenset("0123456789.")
 
 
 def parse_duration(token: str) -> Duration:
     token = token.strip()
-    m = re.match(r"^(?P<num>[0-9.]+)\s*(?P<unit>ns|µs|us|ms|s)$", token)
-    if not m:
+    # The grammar is "<digits and dots><optional spaces><unit>", so split at the trailing unit.
+    split = len(token)
+    while split and (token[split - 1].isalpha() or token[split - 1] == "µ"):
+        split -= 1
+    num, unit = token[:split].rstrip(), token[split:]
+    scale = _MICROS_PER_UNIT.get(unit)
+    if scale is None or not num or not _DURATION_NUM_CHARS.issuperset(num):
         raise ValueError(f"Unrecognized duration token: {token!r}")
-    num = float(m.group("num"))
-    unit = m.group("unit")
-
-    if unit == "ns":
-        micros = num / 1_000.0
-    elif unit in ("µs", "us"):
-        micros = num
-    elif unit == "ms":
-        micros = num * 1_000.0
-    elif unit == "s":
-        micros = num * 1_000_000.0
-    else:
-        raise ValueError(f"Unrecognized duration unit: {unit!r}")
-
-    return Duration(micros=micros, raw=token)
+    return Duration(micros=float(num) * scale, raw=token)
 
 
 def gmean(values: Iterable[float]) -> float:
-    vals = [v for v in values if v > 0.0 and math.isfinite(v)]
-    if not vals:
+    logs = [math.log(v) for v in values if v > 0.0 and math.isfinite(v)]
+    if not logs:
         return float("nan")
-    return math.exp(sum(math.log(v) for v in vals) / len(vals))
+    return math.exp(statistics.fmean(logs))
 
 
 def run(cmd: list[str], cwd: Path, *, env: dict[str, str] | None = None) -> str:
@@ -91,110 +100,127 @@ def run(cmd: list[str], cwd: Path, *, env: dict[str, str] | None = None) -> str:
     return proc.stdout
 
 
-def extract_mid_time(output: str, expected_bench: str) -> Duration:
-    def parse_body(body: str) -> Duration:
-        parts = body.strip().split()
+def parse_time_body(body: str) -> Duration:
+    parts = body.strip().split()
+
+    tokens: list[str]
+    if len(parts) == 6:
+        tokens = [
+            f"{parts[0]} {parts[1]}",
+            f"{parts[2]} {parts[3]}",
+            f"{parts[4]} {parts[5]}",
+        ]
+    elif len(parts) == 3:
+        tokens = [parts[0], parts[1], parts[2]]
+    else:
+        raise RuntimeError(f"Unrecognized Criterion time format: {body!r}")
+
+    return parse_duration(tokens[1])
 
-        tokens: list[str]
-        if len(parts) == 6:
-            tokens = [
-                f"{parts[0]} {parts[1]}",
-                f"{parts[2]} {parts[3]}",
-                f"{parts[4]} {parts[5]}",
-            ]
-        elif len(parts) == 3:
-            tokens = [parts[0], parts[1], parts[2]]
-        else:
-            raise RuntimeError(f"Unrecognized Criterion time format: {body!r}")
 
-        return parse_duration(tokens[1])
+def _time_bodies(output: str | Iterable[str]) -> dict[str, str]:
+    """
+    Map each bench name to the body of its first Criterion time line, in one pass.
 
-    lines = [ln.rstrip("\n") for ln in output.splitlines()]
+    Two shapes are recognized; the single-line one wins when both appear for a bench:
 
-    # Format A: single line: "<bench> time: [lo mid hi]".
-    for line in lines:
-        m = TIME_LINE_RE.match(line.strip())
-        if not m:
-            continue
-        if m.group("bench") != expected_bench:
+    - Format A: "<bench> time: [lo mid hi]".
+    - Format B: "<bench>" followed within five lines by "    time: [lo mid hi]".
+
+    `output` may be a complete log or a stream of lines, such as `run_lines` output.
+    """
+    inline: dict[str, str] = {}
+    two_line: dict[str, str] = {}
+    # Bare bench-name lines that a later time-only line may still belong to.
+    recent_names: collections.deque[tuple[int, str]] = collections.deque()
+
+    lines = output.splitlines() if isinstance(output, str) else output
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        while recent_names and index - recent_names[0][0] > 5:
+            recent_names.popleft()
+        if "time:" not in line:
+            if BENCH_NAME_RE.match(stripped):
+                recent_names.append((index, stripped))
             continue
-        return parse_body(m.group("body"))
 
-    # Format B: two lines:
-    #   <bench>
-    #       time: [lo mid hi]
-    for i, line in enumerate(lines):
-        if line.strip() != expected_bench:
+        m = TIME_LINE_RE.match(stripped)
+        if m:
+            inline.setdefault(m.group("bench"), m.group("body"))
+            continue
+        m = TIME_ONLY_RE.match(line)
+        if not m:
             continue
-        for j in range(i + 1, min(i + 6, len(lines))):
-            m = TIME_ONLY_RE.match(lines[j])
-            if not m:
-                continue
-            return parse_body(m.group("body"))
+        for _, name in recent_names:
+            two_line.setdefault(name, m.group("body"))
+
+    return {**two_line, **inline}
+
+
+def extract_mid_time(output: str | Iterable[str], expected_bench: str) -> Duration:
+    body = _time_bodies(output).get(expected_bench)
+    if body is None:
+        raise RuntimeError(f"Could not find Criterion time line for {expected_bench!r}")
+    return parse_time_body(body)
 
-    raise RuntimeError(f"Could not find Criterion time line for {expected_bench!r}")
 
+# The prebuild output is captured and parsed, so pin cargo's terminal styling off even when the
+# caller's environment forces it on (e.g. CI exporting CARGO_TERM_COLOR=always).
+CARGO_CAPTURE_ENV = {"CARGO_TERM_COLOR": "never", "CARGO_TERM_PROGRESS_WHEN": "never"}
+MERMAN_CRITERION_TARGET = {"bench_bin": "pipeline", "package": "merman", "features": "svg"}
+MMDR_CRITERION_TARGET = {"bench_bin": "renderer", "package": None, "features": "benchmark"}
 
-def cargo_bench_cmd(
+
+def prepare_runner(
     *,
-    sample_size: int,
-    warm_up: int,
-    measurement: int,
-    exact: str,
+    cwd: Path,
+    bench_bin: str,
     package: str | None,
     features: str | None,
-    bench: str,
-    locked: bool,
     toolchain: str | None,
-) -> list[str]:
-    cmd = ["cargo"]
-    if toolchain:
-        cmd.append(f"+{toolchain}")
-    cmd.append("bench")
-    if locked:
-        cmd.append("--locked")
-    if package:
-        cmd.extend(["-p", package])
-    if features:
-        cmd.extend(["--features", features])
-    cmd.extend(["--bench", bench, "--"])
-    cmd.extend(
-        [
-            "--noplot",
-            "--sample-size",
-            str(sample_size),
-            "--warm-up-time",
-            str(warm_up),
-            "--measurement-time",
-            str(measurement),
-            "--discard-baseline",
-            "--exact",
-            exact,
-        ]
+    env: dict[str, str] | None = None,
+) -> PreparedCriterionRunner:
+    """Build the Criterion bench once and return its executable for direct invocation."""
+    out = run(
+        criterion_prebuild_command(
+            cwd=cwd,
+            bench_bin=bench_bin,
+            package=package,
+            features=features,
+            toolchain=toolchain,
+        ),
+        cwd=cwd,
+        env={**CARGO_CAPTURE_ENV, **(env or {})},
+    )
+    executable = parse_bench_executable(out, cwd=cwd, bench_bin=bench_bin)
+    return PreparedCriterionRunner(
+        executable=executable,
+        sha256=criterion_executable_sha256(executable),
     )
-    return cmd
 
 
-def mmdr_bench_cmd(
+def criterion_sample_cmd(
+    runner: PreparedCriterionRunner,
     *,
     sample_size: int,
     warm_up: int,
     measurement: int,
     exact: str,
-    locked: bool,
-    toolchain: str | None,
 ) -> list[str]:
-    return cargo_bench_cmd(
-        sample_size=sample_size,
-        warm_up=warm_up,
-        measurement=measurement,
-        exact=exact,
-        package=None,
-        features="benchmark",
-        bench="renderer",
-        locked=locked,
-        toolchain=toolchain,
-    )
+    return [
+        str(runner.executable),
+        "--bench",
+        "--noplot",
+        "--sample-size",
+        str(sample_size),
+        "--warm-up-time",
+        str(warm_up),
+        "--measurement-time",
+        str(measurement),
+        "--discard-baseline",
+        "--exact",
+        exact,
+    ]
 
 
 def validate_fixture_inputs(repo_root: Path, mmdr_dir: Path, fixtures: list[str]) -> None:
@@ -215,6 +241,53 @@ def validate_fixture_inputs(repo_root: Path, mmdr_dir: Path, fixtures: list[str]
         )
 
 
+SpotcheckRow = tuple[str, str, Duration, Duration, float]
+
+
+def render_report(
+    *,
+    rows: list[SpotcheckRow],
+    fixtures: list[str],
+    stages: list[str],
+    sample_size: int,
+    warm_up: int,
+    measurement: int,
+    mmdr_toolchain: str | None,
+    jobs: int,
+) -> str:
+    jobs_line = f"- jobs: `{jobs}` (concurrent runs; expect extra noise)\n" if jobs > 1 else ""
+    table = "".join(
+        f"| `{fixture}` | `{stage}` | {merman_mid.raw} | {mmdr_mid.raw} | {ratio:.2f}x |\n"
+        for fixture, stage, merman_mid, mmdr_mid, ratio in rows
+    )
+    ratios_by_stage: dict[str, list[float]] = collections.defaultdict(list)
+    for _, stage, _, _, ratio in rows:
+        ratios_by_stage[stage].append(ratio)
+    summary = "".join(
+        f"- `{stage}`: `{gmean(ratios_by_stage[stage]):.2f}x`\n" for stage in stages
+    )
+    return f"""# Stage Spot-check (merman vs mermaid-rs-renderer)
+
+This report is intended for quick perf triage (stage attribution).
+
+## Parameters
+
+- sample-size: `{sample_size}`
+- warm-up: `{warm_up}s`
+- measurement: `{measurement}s`
+- mmdr-toolchain: `{mmdr_toolchain or 'default'}`
+{jobs_line}- fixtures: `{', '.join(fixtures)}`
+
+## Results (mid estimate)
+
+| fixture | stage | merman | mmdr | ratio |
+|---|---|---:|---:|---:|
+{table}
+## Summary (geometric mean of ratios)
+
+{summary}"""
+
+
 def main(argv: list[str]) -> int:
     # Windows consoles often default to a legacy code page (e.g. GBK/CP936). Our report contains
     # the micro sign ("µ") in timing units, which can raise UnicodeEncodeError when writing to
@@ -256,6 +329,15 @@ def main(argv: list[str]) -> int:
             "(e.g. 1.92.0)."
         ),
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of (fixture, stage) pairs to benchmark concurrently (default: 1). "
+            "Concurrent Criterion runs share cores and add noise; keep 1 for published numbers."
+        ),
+    )
     ap.add_argument(
         "--out",
         default="",
@@ -274,15 +356,15 @@ def main(argv: list[str]) -> int:
         if not argv_has("--measurement"):
             args.measurement = 3
 
-    repo_root = Path(__file__).resolve().parents[2]
+    repo_root = REPO_ROOT
     mmdr_dir = (repo_root / args.mmdr_dir).resolve()
     mmdr_bench_env = {"MMDR_RUN_CRITERION_BENCHES": "1"}
-    repo_locked = (repo_root / "Cargo.lock").exists()
-    mmdr_locked = (mmdr_dir / "Cargo.lock").exists()
 
     fixtures = [x.strip() for x in args.fixtures.split(",") if x.strip()]
     if not fixtures:
         raise SystemExit("No fixtures specified.")
+    if args.jobs < 1:
+        raise SystemExit("--jobs must be at least 1.")
     try:
         validate_fixture_inputs(repo_root, mmdr_dir, fixtures)
     except ValueError as error:
@@ -291,78 +373,70 @@ def main(argv: list[str]) -> int:
     stages_merman = ["parse", "layout", "render", "end_to_end"]
     stages_mmdr = ["parse", "layout", "render_svg", "end_to_end"]
 
-    rows: list[tuple[str, str, Duration | None, Duration | None, float | None]] = []
-
-    for fixture in fixtures:
-        for stage in stages_merman:
-            mmdr_stage = "render_svg" if stage == "render" else stage
-
-            merman_exact = f"{stage}/{fixture}"
-            mmdr_exact = f"{mmdr_stage}/{fixture}"
-
-            merman_out = run(
-                cargo_bench_cmd(
-                    sample_size=args.sample_size,
-                    warm_up=args.warm_up,
-                    measurement=args.measurement,
-                    exact=merman_exact,
-                    package="merman",
-                    features="svg",
-                    bench="pipeline",
-                    locked=repo_locked,
-                    toolchain=None,
-                ),
-                cwd=repo_root,
-            )
-            merman_mid = extract_mid_time(merman_out, expected_bench=merman_exact)
-
-            mmdr_out = run(
-                mmdr_bench_cmd(
-                    sample_size=args.sample_size,
-                    warm_up=args.warm_up,
-                    measurement=args.measurement,
-                    exact=mmdr_exact,
-                    locked=mmdr_locked,
-                    toolchain=args.mmdr_toolchain,
-                ),
-                cwd=mmdr_dir,
-                env=mmdr_bench_env,
-            )
-            mmdr_mid = extract_mid_time(mmdr_out, expected_bench=mmdr_exact)
-
-            ratio = merman_mid.micros / mmdr_mid.micros if mmdr_mid.micros > 0 else float("nan")
-            rows.append((fixture, stage, merman_mid, mmdr_mid, ratio))
-
-    lines: list[str] = []
-    lines.append("# Stage Spot-check (merman vs mermaid-rs-renderer)")
-    lines.append("")
-    lines.append("This report is intended for quick perf triage (stage attribution).")
-    lines.append("")
-    lines.append("## Parameters")
-    lines.append("")
-    lines.append(f"- sample-size: `{args.sample_size}`")
-    lines.append(f"- warm-up: `{args.warm_up}s`")
-    lines.append(f"- measurement: `{args.measurement}s`")
-    lines.append(f"- mmdr-toolchain: `{args.mmdr_toolchain or 'default'}`")
-    lines.append(f"- fixtures: `{', '.join(fixtures)}`")
-    lines.append("")
-    lines.append("## Results (mid estimate)")
-    lines.append("")
-    lines.append("| fixture | stage | merman | mmdr | ratio |")
-    lines.append("|---|---|---:|---:|---:|")
-    for fixture, stage, merman_mid, mmdr_mid, ratio in rows:
-        lines.append(
-            f"| `{fixture}` | `{stage}` | {merman_mid.raw} | {mmdr_mid.raw} | {ratio:.2f}x |"
-        )
-
-    lines.append("")
-    lines.append("## Summary (geometric mean of ratios)")
-    lines.append("")
-    for stage in stages_merman:
-        ratios = [r for f, s, _, _, r in rows if s == stage and r is not None]
-        lines.append(f"- `{stage}`: `{gmean(ratios):.2f}x`")
+    # Each side is compiled once; every (fixture, stage) pair then runs the prebuilt executable
+    # instead of paying cargo's startup and freshness checks per pair.
+    merman_runner = prepare_runner(cwd=repo_root, toolchain=None, **MERMAN_CRITERION_TARGET)
+    mmdr_runner = prepare_runner(
+        cwd=mmdr_dir,
+        toolchain=args.mmdr_toolchain,
+        env=mmdr_bench_env,
+        **MMDR_CRITERION_TARGET,
+    )
 
-    out = "\n".join(lines) + "\n"
+    def bench_one(fixture: str, stage: str) -> SpotcheckRow:
+        mmdr_stage = "render_svg" if stage == "render" else stage
+
+        merman_exact = f"{stage}/{fixture}"
+        mmdr_exact = f"{mmdr_stage}/{fixture}"
+
+        # Sampling output is parsed as it streams; only the command's tail is kept for errors.
+        merman_out = run_lines(
+            criterion_sample_cmd(
+                merman_runner,
+                sample_size=args.sample_size,
+                warm_up=args.warm_up,
+                measurement=args.measurement,
+                exact=merman_exact,
+            ),
+            cwd=repo_root,
+            echo=False,
+        )
+        merman_mid = extract_mid_time(merman_out, expected_bench=merman_exact)
+
+        mmdr_out = run_lines(
+            criterion_sample_cmd(
+                mmdr_runner,
+                sample_size=args.sample_size,
+                warm_up=args.warm_up,
+                measurement=args.measurement,
+                exact=mmdr_exact,
+            ),
+            cwd=mmdr_dir,
+            env=mmdr_bench_env,
+            echo=False,
+        )
+        mmdr_mid = extract_mid_time(mmdr_out, expected_bench=mmdr_exact)
+
+        ratio = merman_mid.micros / mmdr_mid.micros if mmdr_mid.micros > 0 else float("nan")
+        return (fixture, stage, merman_mid, mmdr_mid, ratio)
+
+    pairs = list(itertools.product(fixtures, stages_merman))
+    # `map` yields in submission order, so the table stays in (fixture, stage) order.
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        rows: list[SpotcheckRow] = list(pool.map(lambda pair: bench_one(*pair), pairs))
+    for runner in (merman_runner, mmdr_runner):
+        verify_criterion_executable(runner)
+
+    out = render_report(
+        rows=rows,
+        fixtures=fixtures,
+        stages=stages_merman,
+        sample_size=args.sample_size,
+        warm_up=args.warm_up,
+        measurement=args.measurement,
+        mmdr_toolchain=args.mmdr_toolchain,
+        jobs=args.jobs,
+    )
     if args.out:
         out_path = (repo_root / args.out).resolve()
         out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -3816,6 +3816,13 @@ class CompareSelfStatisticsContractsTest(unittest.TestCase):
 
 
 class RendererComparisonContractsTest(unittest.TestCase):
+    def test_filter_expansion_keeps_non_literal_alternations_verbatim(self) -> None:
+        expand = compare_mermaid_renderers.expand_filter_to_exact_benches
+        self.assertEqual(expand(" parse/(a| b_1 |c-2) "), ["parse/a", "parse/b_1", "parse/c-2"])
+        self.assertEqual(expand("parse/(a|b.*)"), ["parse/(a|b.*)"])
+        self.assertEqual(expand("parse/(a|é)"), ["parse/(a|é)"])
+        self.assertEqual(expand("parse/a"), ["parse/a"])
+
     def test_default_markdown_report_stays_outside_docs_tree(self) -> None:
         self.assertEqual(
             compare_mermaid_renderers.DEFAULT_MARKDOWN_OUT,
@@ -3826,6 +3833,50 @@ class RendererComparisonContractsTest(unittest.TestCase):
         self.assertEqual(compare_mermaid_renderers.fmt_ratio(0.0025), "<0.01x")
         self.assertEqual(compare_mermaid_renderers.fmt_ratio(0.025), "0.03x")
 
+    def test_parses_inline_and_split_criterion_time_lines_for_one_prefix(self) -> None:
+        output = (
+            "   Compiling merman v0.1.0\n"
+            "end_to_end/inline  time:   [1.0 µs 2.5 µs 3.0 µs]\n"
+            "parse/inline  time:   [1.0 ms 9.0 ms 9.5 ms]\n"
+            "\x1b[1mend_to_end/split\x1b[0m\n"
+            "                        time:   [100.0 ns 200.0 ns 300.0 ns]\n"
+            "parse/other\n"
+            "                        time:   [1.0 s 2.0 s 3.0 s]\n"
+        )
+
+        times = compare_mermaid_renderers.parse_criterion_times(
+            output, prefix="end_to_end"
+        )
+
+        self.assertEqual(times, {"inline": 2500.0, "split": 200.0})
+
+    def test_markdown_report_failure_keeps_the_previous_report(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_path = Path(temp_dir) / "report.md"
+            out_path.write_text("previous\n", encoding="utf-8")
+            environment = {
+                key: "x"
+                for key in ("os", "machine", "cpu", "python", "mmdr_toolchain", "rust", "mmdr_rust")
+            }
+            # The report lacks its contract section, so writing fails part-way through.
+            report = {
+                "generated_at": "T",
+                "environment": environment,
+                "runners": {"merman": {}, "mermaid_rs_renderer": {}, "mermaid_js": {}},
+            }
+
+            with self.assertRaises(KeyError):
+                compare_mermaid_renderers.write_markdown(out_path, report)
+
+            self.assertEqual(out_path.read_text(encoding="utf-8"), "previous\n")
+            self.assertEqual(sorted(p.name for p in Path(temp_dir).iterdir()), ["report.md"])
+
+    def test_criterion_time_with_unknown_unit_fails_with_unit_error(self) -> None:
+        output = "end_to_end/inline  time:   [1.0 ks 2.5 ks 3.0 ks]\n"
+
+        with self.assertRaisesRegex(ValueError, r"unknown time unit: 'ks'"):
+            compare_mermaid_renderers.parse_criterion_times(output, prefix="end_to_end")
+
     def test_renderer_subprocess_timeout_fails_with_command_context(self) -> None:
         timeout = subprocess.TimeoutExpired(["renderer"], 7, output="partial output")
         with mock.patch.object(subprocess, "run", side_effect=timeout):
@@ -3836,6 +3887,63 @@ class RendererComparisonContractsTest(unittest.TestCase):
         self.assertIn("partial output", str(raised.exception))
         self.assertIn("renderer --bench", str(raised.exception))
 
+    def test_streamed_renderer_output_echoes_with_runner_prefix(self) -> None:
+        echoed = io.StringIO()
+        with redirect_stdout(echoed):
+            lines = list(
+                compare_mermaid_renderers.run_lines(
+                    [sys.executable, "-c", "print('a'); print('b')"],
+                    ROOT,
+                    echo_prefix="[merman] ",
+                )
+            )
+
+        self.assertEqual([line.strip() for line in lines], ["a", "b"])
+        self.assertEqual(echoed.getvalue().splitlines(), ["[merman] a", "[merman] b"])
+
+    def test_pinned_cpus_are_rejected_for_parallel_native_runners(self) -> None:
+        stderr = io.StringIO()
+        with mock.patch.object(
+            compare_mermaid_renderers, "run_lines", side_effect=AssertionError("spawned")
+        ), mock.patch.object(
+            compare_mermaid_renderers.subprocess, "run", side_effect=AssertionError("spawned")
+        ), redirect_stderr(stderr):
+            result = compare_mermaid_renderers.main(["--parallel", "--pin-cpus", "2-3"])
+
+        self.assertEqual(result, 2)
+        self.assertIn("--pin-cpus cannot be combined with --parallel", stderr.getvalue())
+
+    def test_streamed_renderer_output_reports_failure_with_output_tail(self) -> None:
+        script = "print('first'); print('second'); raise SystemExit(3)"
+        lines = compare_mermaid_renderers.run_lines(
+            [sys.executable, "-c", script], ROOT, echo=False, tail_lines=1
+        )
+
+        self.assertEqual(next(lines).strip(), "first")
+        with self.assertRaisesRegex(RuntimeError, r"exit 3") as raised:
+            list(lines)
+        self.assertTrue(str(raised.exception).endswith("\n\nsecond\n"))
+
+    def test_rustc_verbose_runs_rustc_once_per_toolchain_and_cwd(self) -> None:
+        rustc_runs: list[list[str]] = []
+
+        def run(command, **_kwargs):
+            rustc_runs.append(list(command))
+            return subprocess.CompletedProcess(command, 0, stdout="rustc 1.0.0\n")
+
+        compare_mermaid_renderers.rustc_verbose.cache_clear()
+        try:
+            with mock.patch.object(compare_mermaid_renderers.subprocess, "run", side_effect=run):
+                for _ in range(2):
+                    self.assertEqual(
+                        compare_mermaid_renderers.rustc_verbose(cwd=ROOT), "rustc 1.0.0"
+                    )
+                compare_mermaid_renderers.rustc_verbose(toolchain="nightly", cwd=ROOT)
+        finally:
+            compare_mermaid_renderers.rustc_verbose.cache_clear()
+
+        self.assertEqual(rustc_runs, [["rustc", "-Vv"], ["rustc", "+nightly", "-Vv"]])
+
     def test_native_runner_prebuild_records_unique_executable_digest(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             checkout = Path(temp_dir)
@@ -3903,6 +4011,8 @@ class RendererComparisonContractsTest(unittest.TestCase):
             list_output = (
                 "end_to_end/first: benchmark\n"
                 "end_to_end/second: benchmark\n"
+                "end_to_end/third: benchmark\n"
+                "\x1b[33m[bench][skip][end_to_end] fourth: fixture unsupported\x1b[0m\n"
             )
             second_output = (
                 "end_to_end/second\n"
@@ -3911,9 +4021,13 @@ class RendererComparisonContractsTest(unittest.TestCase):
 
             with mock.patch.object(
                 compare_mermaid_renderers,
-                "run",
-                side_effect=[list_output, RuntimeError("first failed"), second_output],
-            ) as run_mock, redirect_stdout(io.StringIO()):
+                "run_lines",
+                side_effect=[
+                    iter(list_output.splitlines(keepends=True)),
+                    RuntimeError("first failed"),
+                    iter(second_output.splitlines(keepends=True)),
+                ],
+            ) as run_lines_mock, redirect_stdout(io.StringIO()):
                 bench_list = compare_mermaid_renderers.list_criterion_benches(
                     cwd=checkout,
                     runner=prepared,
@@ -3931,8 +4045,11 @@ class RendererComparisonContractsTest(unittest.TestCase):
                     env=bench_env,
                 )
 
-            commands = [call.args[0] for call in run_mock.call_args_list]
-            self.assertEqual(run_mock.call_count, 3)
+            calls = run_lines_mock.call_args_list
+            commands = [call.args[0] for call in calls]
+            self.assertEqual(commands[0][-1], "--list")
+            self.assertEqual(bench_list.skipped, {"end_to_end": ["fourth"]})
+            self.assertEqual(run_lines_mock.call_count, 3)
             self.assertTrue(
                 all(
                     command[:2] == [str(executable.resolve()), "--bench"]
@@ -3940,16 +4057,65 @@ class RendererComparisonContractsTest(unittest.TestCase):
                 )
             )
             self.assertNotIn("cargo", {part for command in commands for part in command})
-            self.assertTrue(
-                all(
-                    call.kwargs["env"] == bench_env
-                    for call in run_mock.call_args_list
-                )
-            )
+            self.assertTrue(all(call.kwargs["env"] == bench_env for call in calls))
             self.assertIn("end_to_end/first", result["errors"])
             self.assertEqual(result["times_ns"]["end_to_end/second"], 200.0)
             self.assertEqual(result["executable"]["status"], "verified")
 
+    def test_native_runner_batches_fully_requested_groups(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkout = Path(temp_dir)
+            executable = checkout / "renderer"
+            executable.write_bytes(b"criterion runner")
+            executable.chmod(executable.stat().st_mode | stat.S_IXUSR)
+            prepared = compare_mermaid_renderers.PreparedCriterionRunner(
+                executable=executable.resolve(),
+                sha256=compare_mermaid_renderers._sha256_file(executable),
+            )
+            bench_list = compare_mermaid_renderers.CriterionBenchList(
+                benches={"end_to_end/first", "end_to_end/second", "parse/first"},
+                skipped={},
+            )
+            group_output = (
+                "end_to_end/first\n"
+                "time:   [1.0 ns 2.0 ns 3.0 ns]\n"
+                "end_to_end/second\n"
+                "time:   [4.0 ns 5.0 ns 6.0 ns]\n"
+            )
+
+            with mock.patch.object(
+                compare_mermaid_renderers,
+                "run_lines",
+                return_value=iter(group_output.splitlines(keepends=True)),
+            ) as run_lines_mock, redirect_stdout(io.StringIO()):
+                result = compare_mermaid_renderers.run_native_runner(
+                    label="merman",
+                    cwd=checkout,
+                    runner=prepared,
+                    exact_benches=["end_to_end/first", "end_to_end/second"],
+                    bench_list=bench_list,
+                    sample_size=20,
+                    warm_up=1,
+                    measurement=1,
+                )
+
+            self.assertEqual(run_lines_mock.call_count, 1)
+            command = run_lines_mock.call_args.args[0]
+            self.assertEqual(command[-1], "end_to_end/")
+            self.assertNotIn("--exact", command)
+            self.assertEqual(
+                result["times_ns"],
+                {"end_to_end/first": 2.0, "end_to_end/second": 5.0},
+            )
+            self.assertEqual(result["batched_groups"], ["end_to_end"])
+            self.assertEqual(
+                compare_mermaid_renderers.batchable_groups(
+                    ["end_to_end/first", "parse/first"],
+                    {"end_to_end/first", "end_to_end/first_large", "parse/first"},
+                ),
+                {},
+            )
+
     def test_excludes_nonidentical_fixture_inputs_from_mmdr_ratios(self) -> None:
         runner = {
             "times_ns": {"end_to_end/example": 200.0},
@@ -4256,14 +4422,26 @@ class RendererComparisonContractsTest(unittest.TestCase):
 
 
 class StageSpotcheckContractsTest(unittest.TestCase):
+    def test_extracts_mid_time_from_inline_and_two_line_output(self) -> None:
+        output = (
+            "parse/example time: [1.0 ns 2.5 ns 3.0 ns]\n"
+            "layout/example\n"
+            "                        time:   [1.0 ms 1.5 ms 2.0 ms]\n"
+        )
+
+        parse = stage_spotcheck.extract_mid_time(output, expected_bench="parse/example")
+        layout = stage_spotcheck.extract_mid_time(output, expected_bench="layout/example")
+
+        self.assertEqual(parse, stage_spotcheck.Duration(micros=0.0025, raw="2.5 ns"))
+        self.assertEqual(layout, stage_spotcheck.Duration(micros=1500.0, raw="1.5 ms"))
+        with self.assertRaisesRegex(ValueError, "Unrecognized duration token"):
+            stage_spotcheck.parse_duration("2.5 ks")
+
     def test_mmdr_command_enables_benchmark_feature(self) -> None:
-        command = stage_spotcheck.mmdr_bench_cmd(
-            sample_size=30,
-            warm_up=2,
-            measurement=3,
-            exact="parse/requirement_medium",
-            locked=True,
+        command = compare_mermaid_renderers.criterion_prebuild_command(
+            cwd=Path("mmdr"),
             toolchain=None,
+            **stage_spotcheck.MMDR_CRITERION_TARGET,
         )
 
         self.assertIn("--features", command)
@@ -4271,6 +4449,46 @@ class StageSpotcheckContractsTest(unittest.TestCase):
         self.assertEqual(command[feature_index + 1], "benchmark")
         self.assertIn("renderer", command)
 
+    def test_report_lists_rows_and_per_stage_geomeans(self) -> None:
+        duration = stage_spotcheck.Duration
+        report = stage_spotcheck.render_report(
+            rows=[
+                ("a", "parse", duration(1.0, "1.0 µs"), duration(4.0, "4.0 µs"), 0.25),
+                ("b", "parse", duration(4.0, "4.0 µs"), duration(1.0, "1.0 µs"), 4.0),
+            ],
+            fixtures=["a", "b"],
+            stages=["parse", "layout"],
+            sample_size=20,
+            warm_up=1,
+            measurement=1,
+            mmdr_toolchain=None,
+            jobs=1,
+        )
+
+        self.assertIn("- mmdr-toolchain: `default`\n- fixtures: `a, b`\n", report)
+        self.assertIn("| `a` | `parse` | 1.0 µs | 4.0 µs | 0.25x |\n", report)
+        self.assertIn("- `parse`: `1.00x`\n- `layout`: `nanx`\n", report)
+        self.assertTrue(report.endswith("`nanx`\n"))
+        self.assertNotIn("jobs", report)
+
+    def test_samples_prebuilt_executable_by_exact_name(self) -> None:
+        runner = compare_mermaid_renderers.PreparedCriterionRunner(
+            executable=Path("/tmp/renderer-abc"),
+            sha256="0" * 64,
+        )
+
+        command = stage_spotcheck.criterion_sample_cmd(
+            runner,
+            sample_size=30,
+            warm_up=2,
+            measurement=3,
+            exact="parse/requirement_medium",
+        )
+
+        self.assertEqual(command[:2], [str(runner.executable), "--bench"])
+        self.assertEqual(command[-2:], ["--exact", "parse/requirement_medium"])
+        self.assertNotIn("cargo", command)
+
     def test_rejects_nonidentical_fixture_inputs_before_benchmarking(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = Path(temp_dir)
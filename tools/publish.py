@@ -3,10 +3,12 @@
 Publish merman workspace crates to crates.io in dependency order.
 
 This is intentionally boring and explicit: a small helper around `cargo publish` that:
-- optionally runs `cargo run -p xtask -- verify` once up-front (parity gate)
+- optionally runs `cargo run -p xtask -- verify` once up-front (parity gate), remembering a
+  pass per clean commit and toolchain under the cargo target dir so retries skip it
 - optionally runs `cargo publish --dry-run` per crate before uploading
 - publishes crates in a fixed order
-- waits between publishes for crates.io indexing
+- after each publish, polls the crates.io index with backoff until the new version shows up
+  (bounded by --wait)
 
 Usage:
   python tools/publish.py --dry-run
@@ -19,16 +21,30 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import base64
+import functools
+import hashlib
+import http.client
+import io
 import json
+import os
+import re
+import shlex
 import shutil
 import subprocess
 import sys
+import threading
 import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Optional
 
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 PUBLISH_ORDER = [
     # Layout stack.
     "dugong-graphlib",
@@ -55,6 +71,11 @@ PUBLISH_ORDER = [
     "merman-uniffi",
     "merman-wasm",
 ]
+PUBLISH_ORDER_SET = frozenset(PUBLISH_ORDER)
+PUBLISH_ORDER_INDEX = {name: i for i, name in enumerate(PUBLISH_ORDER)}
+
+
+TERMINAL_DEVICE = "/dev/tty"
 
 
 class Colors:
@@ -67,6 +88,22 @@ class Colors:
     BOLD = "\033[1m"
 
 
+def _use_color(stream) -> bool:
+    # Plain output for logs and pipes; see https://no-color.org.
+    return not os.environ.get("NO_COLOR") and stream.isatty()
+
+
+def _disable_colors_unless_terminal() -> None:
+    if not _use_color(sys.stdout):
+        for name in ("HEADER", "OKBLUE", "OKGREEN", "WARNING", "FAIL", "ENDC", "BOLD"):
+            setattr(Colors, name, "")
+
+
+# Errors go to stderr, which can be a terminal while stdout is piped (or the reverse).
+_ERROR_COLOR, _ERROR_RESET = (Colors.FAIL, Colors.ENDC) if _use_color(sys.stderr) else ("", "")
+_disable_colors_unless_terminal()
+
+
 def print_header(msg: str) -> None:
     bar = "=" * 80
     print(f"\n{Colors.HEADER}{Colors.BOLD}{bar}{Colors.ENDC}")
@@ -87,7 +124,7 @@ def print_warning(msg: str) -> None:
 
 
 def print_error(msg: str) -> None:
-    print(f"{Colors.FAIL}ERR: {msg}{Colors.ENDC}", file=sys.stderr)
+    print(f"{_ERROR_COLOR}ERR: {msg}{_ERROR_RESET}", file=sys.stderr)
 
 
 def run_command(
@@ -96,35 +133,75 @@ def run_command(
     cwd: Optional[Path] = None,
     dry_run: bool = False,
     capture: bool = False,
+    capture_bytes: bool = False,
+    discard_stderr: bool = False,
     quiet: bool = False,
-) -> subprocess.CompletedProcess[str]:
-    cmd_str = " ".join(str(c) for c in cmd)
+) -> subprocess.CompletedProcess:
+    """
+    Run `cmd`, optionally capturing its output.
+
+    `capture` decodes stdout/stderr as UTF-8 text; `capture_bytes` leaves them as raw bytes for
+    callers that hand the output straight to a bytes-aware parser. With `discard_stderr`, a
+    captured command's stderr goes to /dev/null instead of being buffered for nobody.
+    """
     if not quiet:
-        print_info(f"Running: {cmd_str}")
+        print_info(f"Running: {shlex.join(map(str, cmd))}")
     if dry_run:
         print_warning("DRY RUN: command not executed")
-        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="", stderr="")
+        empty = b"" if capture_bytes else ""
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=empty, stderr=empty)
 
-    if capture:
+    if capture or capture_bytes:
+        text_kwargs = (
+            {} if capture_bytes else {"text": True, "encoding": "utf-8", "errors": "replace"}
+        )
         return subprocess.run(
             cmd,
             cwd=str(cwd) if cwd else None,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL if discard_stderr else subprocess.PIPE,
             check=False,
+            **text_kwargs,
         )
     return subprocess.run(cmd, cwd=str(cwd) if cwd else None, check=False)
 
 
+def read_terminal_line(prompt: str) -> Optional[str]:
+    """
+    Prompt on the controlling terminal and return the answer, or `None` without one.
+
+    Reading `/dev/tty` rather than stdin keeps piped input (e.g. from an automation harness)
+    from being consumed as an answer. End of input counts as no answer, never as consent.
+    """
+    try:
+        # A terminal is not seekable, so it cannot back a buffered "r+" text file.
+        raw = open(TERMINAL_DEVICE, "r+b", buffering=0)
+    except OSError:
+        if not sys.stdin.isatty():
+            return None
+        try:
+            return input(prompt)
+        except EOFError:
+            return None
+    with io.TextIOWrapper(raw, encoding="utf-8", errors="replace", write_through=True) as tty:
+        try:
+            tty.write(prompt)
+            line = tty.readline()
+        except OSError:
+            return None
+    # A bare Enter reads as "\n"; an empty string means the terminal hit EOF.
+    return line or None
+
+
 def require_tool(name: str) -> None:
     if shutil.which(name) is None:
         raise RuntimeError(f"Required tool not found in PATH: {name}")
 
 
 def git_is_clean(repo_root: Path) -> bool:
-    cp = run_command(["git", "status", "--porcelain"], cwd=repo_root, capture=True)
+    cp = run_command(
+        ["git", "status", "--porcelain"], cwd=repo_root, capture=True, discard_stderr=True
+    )
     if cp.returncode != 0:
         raise RuntimeError("Failed to run git status")
     return cp.stdout.strip() == ""
@@ -139,15 +216,34 @@ class PackageInfo:
     internal_deps: tuple[str, ...]
 
 
+CARGO_METADATA_COMMAND = ["cargo", "metadata", "--format-version", "1", "--no-deps"]
+XTASK_VERIFY_COMMAND = ["cargo", "run", "-p", "xtask", "--", "verify"]
+
+
 def cargo_metadata(repo_root: Path, *, quiet: bool = False) -> dict:
+    """
+    Return `cargo metadata --no-deps` for the workspace, parsed once per run.
+
+    `quiet` only suppresses the log line; quiet and verbose callers share one cached result,
+    which must be treated as read-only.
+    """
+    if not quiet:
+        print_info(f"Reading workspace metadata: {shlex.join(CARGO_METADATA_COMMAND)}")
+    return _cargo_metadata(repo_root)
+
+
+@functools.lru_cache(maxsize=None)
+def _cargo_metadata(repo_root: Path) -> dict:
     cp = run_command(
-        ["cargo", "metadata", "--format-version", "1", "--no-deps"],
+        CARGO_METADATA_COMMAND,
         cwd=repo_root,
-        capture=True,
-        quiet=quiet,
+        capture_bytes=True,
+        discard_stderr=True,
+        quiet=True,
     )
     if cp.returncode != 0:
         raise RuntimeError("cargo metadata failed")
+    # json.loads detects the UTF-8 encoding itself; skipping the str decode avoids a full copy.
     return json.loads(cp.stdout)
 
 
@@ -162,7 +258,6 @@ def publish_field_allows_crates_io(publish_raw: object) -> bool:
 def get_workspace_packages(repo_root: Path) -> dict[str, PackageInfo]:
     md = cargo_metadata(repo_root)
     out: dict[str, PackageInfo] = {}
-    publish_set = set(PUBLISH_ORDER)
     for pkg in md.get("packages", []):
         name = pkg["name"]
         version = pkg["version"]
@@ -170,7 +265,11 @@ def get_workspace_packages(repo_root: Path) -> dict[str, PackageInfo]:
         manifest_path = Path(pkg["manifest_path"])
         deps = pkg.get("dependencies", []) or []
         internal_deps = sorted(
-            {d.get("name") for d in deps if d.get("name") in publish_set and d.get("name") != name}
+            {
+                d.get("name")
+                for d in deps
+                if d.get("name") in PUBLISH_ORDER_SET and d.get("name") != name
+            }
         )
         out[name] = PackageInfo(
             name=name,
@@ -194,20 +293,232 @@ def get_crates_io_package_names(repo_root: Path) -> list[str]:
     return crates_io_publishable_package_names(cargo_metadata(repo_root, quiet=True))
 
 
-def check_crate_published(crate_name: str, version: str) -> bool:
+CRATES_IO_SPARSE_INDEX_HOST = "index.crates.io"
+INDEX_FETCH_TIMEOUT_SECONDS = 5
+INDEX_FETCH_WORKERS = 8
+INDEX_POLL_INITIAL_SECONDS = 1.0
+INDEX_POLL_MAX_SECONDS = 8.0
+_INDEX_CONNECTIONS = threading.local()
+
+
+def crates_io_index_path(crate_name: str) -> str:
+    """Return the sparse-index path for a crate, following cargo's name-length layout."""
+    name = crate_name.lower()
+    if len(name) <= 2:
+        return f"{len(name)}/{name}"
+    if len(name) == 3:
+        return f"3/{name[0]}/{name}"
+    return f"{name[:2]}/{name[2:4]}/{name}"
+
+
+def _index_connection() -> http.client.HTTPSConnection:
+    # One keep-alive connection per thread: the prefetch pool and the post-publish poller each
+    # pay the TLS handshake once instead of per lookup.
+    conn = getattr(_INDEX_CONNECTIONS, "conn", None)
+    if conn is None:
+        proxy = _index_proxy()
+        if proxy is None:
+            conn = http.client.HTTPSConnection(
+                CRATES_IO_SPARSE_INDEX_HOST, timeout=INDEX_FETCH_TIMEOUT_SECONDS
+            )
+        else:
+            # Same proxy settings urllib would honor: CONNECT through it and run TLS inside.
+            conn = http.client.HTTPSConnection(
+                proxy.hostname, proxy.port or 80, timeout=INDEX_FETCH_TIMEOUT_SECONDS
+            )
+            headers = {}
+            if proxy.username is not None:
+                credentials = f"{urllib.parse.unquote(proxy.username)}:"
+                credentials += urllib.parse.unquote(proxy.password or "")
+                token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+                headers["Proxy-Authorization"] = f"Basic {token}"
+            conn.set_tunnel(CRATES_IO_SPARSE_INDEX_HOST, headers=headers)
+        _INDEX_CONNECTIONS.conn = conn
+    return conn
+
+
+def _index_proxy() -> Optional[urllib.parse.SplitResult]:
+    # `getproxies` reads HTTPS_PROXY/https_proxy (and the platform settings); NO_PROXY applies.
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(CRATES_IO_SPARSE_INDEX_HOST):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    return urllib.parse.urlsplit(proxy)
+
+
+def _drop_index_connection() -> None:
+    conn = getattr(_INDEX_CONNECTIONS, "conn", None)
+    if conn is not None:
+        conn.close()
+        _INDEX_CONNECTIONS.conn = None
+
+
+def fetch_index_versions(crate_name: str) -> Optional[set[str]]:
     """
-    Best-effort "already published?" check.
+    Return the non-yanked versions the crates.io sparse index lists for a crate.
 
-    We intentionally use `cargo search` to avoid hardcoding crates.io API calls.
+    An unknown crate yields an empty set; `None` means the index could not be reached.
     """
-    cp = run_command(["cargo", "search", crate_name, "--limit", "1"], capture=True)
+    path = f"/{crates_io_index_path(crate_name)}"
+    # A keep-alive connection the server already closed fails on first use; retry once fresh.
+    for attempt in range(2):
+        conn = _index_connection()
+        try:
+            conn.request("GET", path, headers={"User-Agent": "merman-publish-helper"})
+            resp = conn.getresponse()
+            body = resp.read().decode("utf-8", errors="replace")
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            _drop_index_connection()
+            if attempt == 0:
+                continue
+            return None
+        except (http.client.HTTPException, OSError):
+            _drop_index_connection()
+            return None
+        break
+    if resp.status == 404:
+        return set()
+    if resp.status != 200:
+        return None
+    versions: set[str] = set()
+    for line in body.splitlines():
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if (
+            isinstance(entry, dict)
+            and isinstance(entry.get("vers"), str)
+            and entry.get("yanked") is not True
+        ):
+            versions.add(entry["vers"])
+    return versions
+
+
+def wait_for_index(crate_name: str, version: str, max_seconds: float) -> bool:
+    """
+    Poll the sparse index until `version` is listed, for at most `max_seconds`.
+
+    The delay between polls doubles from `INDEX_POLL_INITIAL_SECONDS` up to
+    `INDEX_POLL_MAX_SECONDS`, like cargo's own `publish.timeout` wait. Returns whether the version
+    became visible. An unreachable index just keeps polling, so the worst case matches a plain
+    `time.sleep(max_seconds)`.
+    """
+    deadline = time.monotonic() + max_seconds
+    delay = INDEX_POLL_INITIAL_SECONDS
+    while True:
+        versions = fetch_index_versions(crate_name)
+        if versions is not None and version in versions:
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, INDEX_POLL_MAX_SECONDS)
+
+
+_CARGO_SEARCH_ROW = re.compile(r'^(?P<name>[A-Za-z0-9_-]+) = "(?P<version>[^"]+)"')
+
+
+def semver_key(version: str) -> tuple:
+    """Sort key for SemVer 2.0 precedence: pre-releases sort first, build metadata is ignored."""
+    core, _, pre = version.split("+", 1)[0].partition("-")
+    numbers = tuple(int(part) for part in core.split("."))
+    if not pre:
+        return (numbers, 1, ())
+    # Numeric identifiers compare numerically and rank below alphanumeric ones.
+    identifiers = tuple(
+        (0, int(ident), "") if ident.isdigit() else (1, 0, ident) for ident in pre.split(".")
+    )
+    return (numbers, 0, identifiers)
+
+
+def published_versions(crate_name: str) -> set[str]:
+    """
+    Best-effort set of published, non-yanked versions of a crate.
+
+    Reads the crates.io sparse index (the same files cargo resolves against) and falls back to
+    `cargo search` when the index cannot be reached, e.g. behind a cargo-configured proxy; that
+    fallback only reports the newest version.
+    """
+    versions = fetch_index_versions(crate_name)
+    if versions is not None:
+        return versions
+    cp = run_command(
+        ["cargo", "search", crate_name, "--limit", "1"], capture=True, discard_stderr=True
+    )
+    if cp.returncode != 0:
+        return set()
+    # Result rows read `<name> = "<version>"    # <description>`; compare the parsed name so a
+    # crate whose name merely ends with `crate_name` cannot match.
+    for line in (cp.stdout or "").splitlines():
+        m = _CARGO_SEARCH_ROW.match(line)
+        if m and m.group("name") == crate_name:
+            return {m.group("version")}
+    return set()
+
+
+def check_crate_published(crate_name: str, version: str) -> bool:
+    """Best-effort "is exactly this version published?" check; yanked versions do not count."""
+    return version in published_versions(crate_name)
+
+
+def newer_published_version(versions: Iterable[str], version: str) -> Optional[str]:
+    """Return the newest of `versions` if it sorts above `version`, else `None`."""
+    newest = max(versions, key=semver_key, default=None)
+    if newest is None or semver_key(newest) <= semver_key(version):
+        return None
+    return newest
+
+
+def git_head_commit(repo_root: Path) -> Optional[str]:
+    cp = run_command(
+        ["git", "rev-parse", "HEAD"], cwd=repo_root, capture=True, discard_stderr=True, quiet=True
+    )
     if cp.returncode != 0:
-        return False
-    needle = f'{crate_name} = "{version}"'
-    return needle in (cp.stdout or "")
+        return None
+    return (cp.stdout or "").strip() or None
+
+
+def rustc_version(repo_root: Path) -> Optional[str]:
+    # Run from the workspace so rustup applies the same override/toolchain file cargo will.
+    cp = run_command(
+        ["rustc", "-vV"], cwd=repo_root, capture=True, discard_stderr=True, quiet=True
+    )
+    if cp.returncode != 0:
+        return None
+    return (cp.stdout or "").strip() or None
+
+
+def xtask_verify_sentinel(repo_root: Path, *, tree_known_clean: bool) -> Optional[Path]:
+    """
+    Return the marker file recording a passed `xtask verify` for the current build inputs.
+
+    A clean tree pins the workspace contents to HEAD; the marker name also fingerprints the
+    active toolchain (`rustc -vV`), `RUSTFLAGS` and the verify command, so a toolchain switch
+    or different flags re-run verify. Dirty trees cannot be fingerprinted cheaply and always
+    return `None` (no caching), as does a toolchain that cannot be queried.
+    """
+    if not tree_known_clean and not git_is_clean(repo_root):
+        return None
+    head = git_head_commit(repo_root)
+    if head is None:
+        return None
+    toolchain = rustc_version(repo_root)
+    if toolchain is None:
+        return None
+    inputs = [toolchain, os.environ.get("RUSTFLAGS", ""), XTASK_VERIFY_COMMAND]
+    fingerprint = hashlib.sha256(json.dumps(inputs).encode("utf-8")).hexdigest()[:16]
+    metadata = cargo_metadata(repo_root, quiet=True)
+    target_dir = metadata.get("target_directory") or repo_root / "target"
+    return Path(target_dir) / f".merman-verify.{head}.{fingerprint}"
+
 
 def git_tag_exists(repo_root: Path, tag: str) -> bool:
-    cp = run_command(["git", "tag", "--list", tag], cwd=repo_root, capture=True)
+    cp = run_command(
+        ["git", "tag", "--list", tag], cwd=repo_root, capture=True, discard_stderr=True
+    )
     if cp.returncode != 0:
         raise RuntimeError("Failed to list git tags")
     return (cp.stdout or "").strip() == tag
@@ -226,13 +537,14 @@ def iter_publish_list(
     requested: Optional[set[str]],
     start_from: Optional[str],
 ) -> list[str]:
-    crates = [c for c in PUBLISH_ORDER if requested is None or c in requested]
+    start = 0
     if start_from:
-        if start_from not in crates:
+        if start_from not in PUBLISH_ORDER_INDEX or (
+            requested is not None and start_from not in requested
+        ):
             raise RuntimeError(f"--start-from crate not in publish list: {start_from}")
-        idx = crates.index(start_from)
-        crates = crates[idx:]
-    return crates
+        start = PUBLISH_ORDER_INDEX[start_from]
+    return [c for c in PUBLISH_ORDER[start:] if requested is None or c in requested]
 
 
 def main() -> int:
@@ -248,6 +560,7 @@ def main() -> int:
         help="Print workspace packages whose Cargo metadata allows crates.io publishing",
     )
     parser.add_argument(
+        "-y",
         "--yes",
         action="store_true",
         help="Assume 'yes' for confirmation prompts (required for non-interactive runs)",
@@ -259,14 +572,27 @@ def main() -> int:
     parser.add_argument("--start-from", help="Start publishing from this crate")
     parser.add_argument(
         "--wait",
+        "--publish-timeout",
+        dest="wait",
         type=int,
         default=30,
-        help="Seconds to wait between publishes for crates.io indexing (default: 30)",
+        help=(
+            "Maximum seconds to wait for each published version to appear in the crates.io "
+            "index before continuing; alias --publish-timeout (default: 30)"
+        ),
     )
     parser.add_argument(
         "--no-verify",
         action="store_true",
-        help="Pass --no-verify to cargo publish (not recommended)",
+        help=(
+            "Pass --no-verify to cargo publish (not recommended). Implied for crates whose "
+            "--preflight-publish-dry-run passed, since that already built the packaged crate"
+        ),
+    )
+    parser.add_argument(
+        "--force-verify",
+        action="store_true",
+        help="Let cargo publish re-verify even after a passing per-crate dry-run preflight",
     )
     parser.add_argument(
         "--preflight-publish-dry-run",
@@ -288,6 +614,11 @@ def main() -> int:
         action="store_true",
         help="Allow publishing with a dirty git working tree (not recommended)",
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Local iteration shortcut for --skip-xtask-verify --allow-dirty",
+    )
     parser.add_argument(
         "--no-check-published",
         action="store_true",
@@ -299,17 +630,21 @@ def main() -> int:
     )
 
     args = parser.parse_args()
+    if args.fast:
+        args.skip_xtask_verify = True
+        args.allow_dirty = True
 
-    repo_root = Path(__file__).resolve().parents[1]
+    repo_root = REPO_ROOT
 
     def confirm(prompt: str, *, default: bool) -> bool:
         if args.yes:
             print_info(f"--yes: auto-confirmed: {prompt}")
             return True
-        if not sys.stdin.isatty():
-            raise RuntimeError(f"Non-interactive session; rerun with --yes to confirm: {prompt}")
         suffix = " [Y/n]: " if default else " [y/N]: "
-        resp = input(prompt + suffix).strip().lower()
+        resp = read_terminal_line(prompt + suffix)
+        if resp is None:
+            raise RuntimeError(f"Non-interactive session; rerun with --yes to confirm: {prompt}")
+        resp = resp.strip().lower()
         if not resp:
             return default
         return resp in ("y", "yes")
@@ -331,19 +666,15 @@ def main() -> int:
             return 2
         return 0
 
-    if not args.allow_dirty:
-        try:
-            if not git_is_clean(repo_root):
-                print_error("Git working tree is not clean. Commit/stash changes or pass --allow-dirty.")
-                return 2
-        except Exception as e:
-            print_error(str(e))
-            return 2
+    # Argument mistakes only need PUBLISH_ORDER; report them before spawning anything.
+    if args.preflight_only and not args.preflight_publish_dry_run:
+        print_error("--preflight-only requires --preflight-publish-dry-run")
+        return 2
 
     requested = None
     if args.crates:
         requested = {c.strip() for c in args.crates.split(",") if c.strip()}
-        unknown = requested - set(PUBLISH_ORDER)
+        unknown = requested - PUBLISH_ORDER_SET
         if unknown:
             print_error(f"Unknown crates: {', '.join(sorted(unknown))}")
             print_info(f"Known crates: {', '.join(PUBLISH_ORDER)}")
@@ -355,6 +686,25 @@ def main() -> int:
         print_error(str(e))
         return 2
 
+    # `cargo metadata` is the slowest startup probe; warm its cache quietly while git status
+    # runs, so the only log lines come from this thread and stay in order.
+    with ThreadPoolExecutor(max_workers=1) as metadata_pool:
+        metadata_future = metadata_pool.submit(cargo_metadata, repo_root, quiet=True)
+        if not args.allow_dirty:
+            try:
+                if not git_is_clean(repo_root):
+                    print_error(
+                        "Git working tree is not clean. Commit/stash changes or pass --allow-dirty."
+                    )
+                    metadata_future.cancel()
+                    return 2
+            except Exception as e:
+                print_error(str(e))
+                metadata_future.cancel()
+                return 2
+        # Re-raises a `cargo metadata` failure here, as the inline call used to.
+        metadata_future.result()
+
     packages = get_workspace_packages(repo_root)
     missing = [c for c in crates if c not in packages]
     if missing:
@@ -366,29 +716,76 @@ def main() -> int:
         print_error(f"Crates are marked publish=false and cannot be published: {', '.join(not_publishable)}")
         return 2
 
-    if args.preflight_only and not args.preflight_publish_dry_run:
-        print_error("--preflight-only requires --preflight-publish-dry-run")
-        return 2
+    # The plan, the upload loop, and every dependent's preflight all ask about the same crates;
+    # each crate's index entry is fetched once and answers all of them.
+    versions_cache: dict[str, set[str]] = {}
+
+    def versions_of(crate_name: str) -> set[str]:
+        if crate_name not in versions_cache:
+            versions_cache[crate_name] = published_versions(crate_name)
+        return versions_cache[crate_name]
+
+    def is_published(crate_name: str, version: str) -> bool:
+        return version in versions_of(crate_name)
+
+    # Resolve every lookup the publish loop will make up front, concurrently, so the plan can
+    # show what is already on crates.io before asking for confirmation; the loop then only
+    # reads the cache.
+    lookup_names: list[str] = []
+    if not args.no_check_published and not args.dry_run and not args.preflight_only:
+        lookup_names.extend(packages[c].name for c in crates)
+    if args.preflight_publish_dry_run and args.preflight_only:
+        lookup_names.extend(
+            dep for c in crates for dep in packages[c].internal_deps if dep in packages
+        )
+    lookup_names = list(dict.fromkeys(lookup_names))
+    if lookup_names:
+        with ThreadPoolExecutor(max_workers=INDEX_FETCH_WORKERS) as pool:
+            list(pool.map(versions_of, lookup_names))
 
     print_header("Publish Plan")
     print_info(f"Repo: {repo_root}")
     print_info(f"Dry run: {args.dry_run}")
-    print_info(f"Wait time: {args.wait}s")
+    print_info(f"Max index wait: {args.wait}s")
     print_info(f"Preflight xtask verify: {not args.skip_xtask_verify}")
-    print_info(f"cargo publish --no-verify: {args.no_verify}")
+    if args.no_verify:
+        upload_verify = "no (--no-verify)"
+    elif args.preflight_publish_dry_run and not args.force_verify:
+        upload_verify = "no (covered by the dry-run preflight)"
+    else:
+        upload_verify = "yes"
+    print_info(f"cargo publish verifies each crate: {upload_verify}")
     print_info(f"Preflight publish --dry-run: {args.preflight_publish_dry_run}")
     print_info(f"Tag after publish: {args.tag or '(none)'}")
     print()
     for i, c in enumerate(crates, 1):
         p = packages[c]
-        print(f"  {i}. {p.name} v{p.version} ({p.manifest_path.parent.relative_to(repo_root)})")
+        status = ""
+        if p.name in versions_cache:
+            versions = versions_cache[p.name]
+            newer = newer_published_version(versions, p.version)
+            if p.version in versions:
+                status = " [already published]"
+            elif newer is not None:
+                status = f" [superseded by v{newer}]"
+            else:
+                status = " [new]"
+        location = p.manifest_path.parent.relative_to(repo_root)
+        print(f"  {i}. {p.name} v{p.version} ({location}){status}")
     print()
 
     if not args.skip_xtask_verify:
-        cp = run_command(["cargo", "run", "-p", "xtask", "--", "verify"], cwd=repo_root, dry_run=args.dry_run)
-        if cp.returncode != 0:
-            print_error("xtask verify failed; aborting publish.")
-            return 1
+        sentinel = xtask_verify_sentinel(repo_root, tree_known_clean=not args.allow_dirty)
+        if sentinel is not None and sentinel.exists():
+            print_info(f"xtask verify cache hit ({sentinel.name}); skipping")
+        else:
+            cp = run_command(XTASK_VERIFY_COMMAND, cwd=repo_root, dry_run=args.dry_run)
+            if cp.returncode != 0:
+                print_error("xtask verify failed; aborting publish.")
+                return 1
+            if sentinel is not None and not args.dry_run:
+                sentinel.parent.mkdir(parents=True, exist_ok=True)
+                sentinel.touch()
 
     if not args.dry_run:
         if not confirm(
@@ -411,19 +808,27 @@ def main() -> int:
             print_header(f"Publishing {p.name} v{p.version}")
 
         if not args.no_check_published and not args.dry_run and not args.preflight_only:
-            if check_crate_published(p.name, p.version):
-                print_warning(f"{p.name} v{p.version} appears already published.")
+            versions = versions_of(p.name)
+            newer = newer_published_version(versions, p.version)
+            if p.version in versions or newer is not None:
+                if p.version in versions:
+                    print_warning(f"{p.name} v{p.version} appears already published.")
+                else:
+                    print_warning(
+                        f"{p.name} v{p.version} appears superseded: v{newer} is already published."
+                    )
                 if confirm("Skip this crate?", default=True):
                     print_info(f"Skipping {p.name}")
                     skipped.append(p.name)
                     continue
 
+        preflight_verified = False
         if args.preflight_publish_dry_run:
             if args.preflight_only and p.internal_deps:
                 missing_internal: list[str] = []
                 for dep in p.internal_deps:
                     dep_ver = packages[dep].version if dep in packages else "(unknown)"
-                    if dep_ver == "(unknown)" or not check_crate_published(dep, dep_ver):
+                    if dep_ver == "(unknown)" or not is_published(dep, dep_ver):
                         missing_internal.append(f"{dep} v{dep_ver}")
                 if missing_internal:
                     print_warning(
@@ -435,6 +840,7 @@ def main() -> int:
 
             pre = ["cargo", "publish", "-p", p.name, "--dry-run"]
             cp = run_command(pre, cwd=repo_root, dry_run=args.dry_run)
+            preflight_verified = cp.returncode == 0
             if cp.returncode != 0:
                 print_error(f"Preflight failed for {p.name}")
                 failures.append(p.name)
@@ -445,7 +851,9 @@ def main() -> int:
                 continue
 
         cmd = ["cargo", "publish", "-p", p.name]
-        if args.no_verify:
+        # The dry-run above already built this crate's packaged tarball; doing it again during
+        # upload would only repeat that build.
+        if args.no_verify or (preflight_verified and not args.force_verify):
             cmd.append("--no-verify")
         cp = run_command(cmd, cwd=repo_root, dry_run=args.dry_run)
         if cp.returncode != 0:
@@ -458,8 +866,15 @@ def main() -> int:
             print_success(f"Published {p.name} v{p.version}")
             ok.append(p.name)
             if not args.dry_run and args.wait > 0:
-                print_info(f"Waiting {args.wait}s for crates.io indexing...")
-                time.sleep(args.wait)
+                print_info(f"Waiting up to {args.wait}s for crates.io indexing...")
+                started = time.monotonic()
+                if wait_for_index(p.name, p.version, args.wait):
+                    elapsed = time.monotonic() - started
+                    print_info(f"{p.name} v{p.version} indexed after {elapsed:.1f}s")
+                else:
+                    print_warning(
+                        f"{p.name} v{p.version} not visible in the index after {args.wait}s"
+                    )
 
     print_header("Publish Result")
     if failures: